@@ -0,0 +1,122 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from char_array_list import CharArrayList  # noqa: E402
+from char_doubly_linked_list import CharDoublyLinkedList  # noqa: E402
+from char_list_io import ASYNC_CHUNK_SIZE  # noqa: E402
+
+LIST_CLASSES = {
+    "array": CharArrayList,
+    "linked": CharDoublyLinkedList,
+}
+
+TICK_SECONDS = 0.001
+
+
+async def _ingest_append(lst, reader, chunk_size):
+    while True:
+        data = await reader.read(chunk_size)
+        if not data:
+            return
+        for char_element in data.decode("ascii"):
+            lst.append(char_element)
+
+
+async def _ingest_aextend(lst, reader, chunk_size):
+    await lst.aextend_from(reader, chunk_size=chunk_size)
+
+
+STRATEGIES = {
+    "append": _ingest_append,
+    "aextend_from": _ingest_aextend,
+}
+
+
+async def _send(sock, payload):
+    loop = asyncio.get_running_loop()
+    await loop.sock_sendall(sock, payload)
+    sock.shutdown(socket.SHUT_WR)
+
+
+async def _monitor(lags, done):
+    while not done.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(time.perf_counter() - started - TICK_SECONDS)
+
+
+async def run_case(list_class, strategy, payload, read_size):
+    receiving, sending = socket.socketpair()
+    sending.setblocking(False)
+    try:
+        reader, writer = await asyncio.open_connection(sock=receiving)
+        lst = list_class()
+        lags = []
+        done = asyncio.Event()
+        monitor = asyncio.ensure_future(_monitor(lags, done))
+        sender = asyncio.ensure_future(_send(sending, payload))
+        started = time.perf_counter()
+        await STRATEGIES[strategy](lst, reader, read_size)
+        elapsed = time.perf_counter() - started
+        done.set()
+        await asyncio.gather(monitor, sender)
+        writer.close()
+        assert lst.length() == len(payload)
+    finally:
+        sending.close()
+    lags.sort()
+    return {
+        "seconds": elapsed,
+        "max_lag_ms": lags[-1] * 1e3 if lags else 0.0,
+        "p99_lag_ms": lags[int(len(lags) * 0.99)] * 1e3 if lags else 0.0,
+        "ticks": len(lags),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure event-loop lag while ingesting text over a socket pair."
+    )
+    parser.add_argument("--megabytes", type=float, default=4.0)
+    parser.add_argument(
+        "--impl",
+        nargs="+",
+        choices=sorted(LIST_CLASSES),
+        default=list(LIST_CLASSES),
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=ASYNC_CHUNK_SIZE,
+        help="Bytes read from the stream per await.",
+    )
+    args = parser.parse_args()
+
+    payload = b"abcdefghij" * int(args.megabytes * (1 << 20) / 10)
+    results = []
+    for name in args.impl:
+        for strategy in STRATEGIES:
+            row = asyncio.run(
+                run_case(LIST_CLASSES[name], strategy, payload, args.chunk_size)
+            )
+            row.update(
+                {"implementation": name, "strategy": strategy, "bytes": len(payload)}
+            )
+            results.append(row)
+            print(
+                f"{name:>7} {strategy:>13} {row['seconds']:8.3f} s  "
+                f"max lag {row['max_lag_ms']:8.2f} ms  p99 {row['p99_lag_ms']:8.2f} ms",
+                file=sys.stderr,
+            )
+    print(json.dumps({"results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
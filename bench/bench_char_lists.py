@@ -0,0 +1,290 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from char_array_list import CharArrayList, STORAGE_COMPACT  # noqa: E402
+from char_doubly_linked_list import CharDoublyLinkedList  # noqa: E402
+from char_gap_buffer_list import CharGapBufferList  # noqa: E402
+from char_rope_list import CharRopeList  # noqa: E402
+from char_unrolled_linked_list import CharUnrolledLinkedList  # noqa: E402
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+IMPLEMENTATIONS = {
+    "array": CharArrayList.from_string,
+    "array-compact": lambda text: CharArrayList.from_string(
+        text, storage=STORAGE_COMPACT
+    ),
+    "linked": CharDoublyLinkedList.from_string,
+    "unrolled": CharUnrolledLinkedList.from_string,
+    "rope": CharRopeList.from_string,
+    "gap": CharGapBufferList.from_string,
+}
+
+
+def _op_append(lst, size, ops, rng):
+    for _ in range(ops):
+        lst.append("z")
+
+
+def _op_insert_head(lst, size, ops, rng):
+    for _ in range(ops):
+        lst.insert("z", 0)
+
+
+def _op_insert_middle(lst, size, ops, rng):
+    for _ in range(ops):
+        lst.insert("z", lst.length() // 2)
+
+
+def _op_insert_tail(lst, size, ops, rng):
+    for _ in range(ops):
+        lst.insert("z", lst.length())
+
+
+def _op_delete(lst, size, ops, rng):
+    for _ in range(ops):
+        lst.delete(rng.randrange(lst.length()))
+
+
+def _op_local_edits(lst, size, ops, rng):
+    position = size // 2
+    for _ in range(ops):
+        position = min(max(position + rng.randint(-3, 3), 0), lst.length() - 1)
+        if rng.random() < 0.7:
+            lst.insert("z", position)
+        else:
+            lst.delete(position)
+
+
+def _op_get(lst, size, ops, rng):
+    for _ in range(ops):
+        lst.get(rng.randrange(size))
+
+
+def _op_deleteAll(lst, size, ops, rng):
+    lst.deleteAll("e")
+
+
+def _op_findFirst(lst, size, ops, rng):
+    lst.findFirst("!")
+
+
+def _op_findLast(lst, size, ops, rng):
+    lst.findLast("!")
+
+
+def _op_clone(lst, size, ops, rng):
+    lst.clone()
+
+
+def _op_reverse(lst, size, ops, rng):
+    lst.reverse()
+
+
+def _op_extend(lst, size, ops, rng):
+    lst.extend(lst.clone())
+
+
+OPERATIONS = {
+    "append": (_op_append, True),
+    "insert_head": (_op_insert_head, True),
+    "insert_middle": (_op_insert_middle, True),
+    "insert_tail": (_op_insert_tail, True),
+    "delete": (_op_delete, True),
+    "local_edits": (_op_local_edits, True),
+    "get": (_op_get, True),
+    "deleteAll": (_op_deleteAll, False),
+    "findFirst": (_op_findFirst, False),
+    "findLast": (_op_findLast, False),
+    "clone": (_op_clone, False),
+    "reverse": (_op_reverse, False),
+    "extend": (_op_extend, False),
+}
+
+
+def _make_text(size, seed):
+    rng = random.Random(seed)
+    return "".join(rng.choice(ALPHABET) for _ in range(size))
+
+
+def run_case(factory, operation, text, ops, seed, repeat):
+    run, _ = OPERATIONS[operation]
+    size = len(text)
+
+    elapsed = float("inf")
+    for _ in range(repeat):
+        lst = factory(text)
+        gc.collect()
+        started = time.perf_counter()
+        run(lst, size, ops, random.Random(seed))
+        elapsed = min(elapsed, time.perf_counter() - started)
+
+    lst = factory(text)
+    gc.collect()
+    tracemalloc.start()
+    run(lst, size, ops, random.Random(seed))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _structure_bytes(factory, text):
+    gc.collect()
+    tracemalloc.start()
+    structure = factory(text)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return current
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(implementations, operations, sizes, per_element_ops, seed, repeat):
+    results = []
+    for size in sizes:
+        text = _make_text(size, seed)
+        for name in implementations:
+            factory = IMPLEMENTATIONS[name]
+            structure_bytes = _structure_bytes(factory, text)
+            for operation in operations:
+                ops = min(per_element_ops, size) if OPERATIONS[operation][1] else 1
+                elapsed, peak = run_case(factory, operation, text, ops, seed, repeat)
+                results.append(
+                    {
+                        "implementation": name,
+                        "operation": operation,
+                        "size": size,
+                        "ops": ops,
+                        "seconds": elapsed,
+                        "seconds_per_op": elapsed / ops,
+                        "peak_bytes": peak,
+                        "structure_bytes": structure_bytes,
+                    }
+                )
+                print(
+                    f"{name:>14} {operation:>13} n={size:<8} "
+                    f"{elapsed / ops * 1e6:12.2f} us/op  peak={peak:>10} B",
+                    file=sys.stderr,
+                )
+    return results
+
+
+def compare(results, baseline_path, threshold):
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    previous = {
+        (row["implementation"], row["operation"], row["size"]): row
+        for row in baseline["results"]
+    }
+    regressions = []
+    for row in results:
+        old_row = previous.get((row["implementation"], row["operation"], row["size"]))
+        if old_row is None or old_row["seconds_per_op"] == 0:
+            continue
+        ratio = row["seconds_per_op"] / old_row["seconds_per_op"]
+        if ratio > threshold:
+            regressions.append(
+                {
+                    **row,
+                    "baseline_seconds_per_op": old_row["seconds_per_op"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time and measure peak memory of every CharList operation."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--impl",
+        nargs="+",
+        choices=sorted(IMPLEMENTATIONS),
+        default=list(IMPLEMENTATIONS),
+    )
+    parser.add_argument(
+        "--ops", nargs="+", choices=list(OPERATIONS), default=list(OPERATIONS)
+    )
+    parser.add_argument(
+        "--per-element-ops",
+        type=int,
+        default=200,
+        help="Number of calls timed for single-element operations.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs per case; the fastest one is reported.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="Slowdown ratio reported as a regression by --compare.",
+    )
+    args = parser.parse_args()
+
+    report = {
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": run_suite(
+            args.impl,
+            args.ops,
+            args.sizes,
+            args.per_element_ops,
+            args.seed,
+            args.repeat,
+        ),
+    }
+    serialized = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(serialized)
+    else:
+        print(serialized)
+
+    if args.compare:
+        regressions = compare(report["results"], args.compare, args.threshold)
+        for row in regressions:
+            print(
+                f"REGRESSION {row['implementation']} {row['operation']} n={row['size']}: "
+                f"{row['ratio']:.2f}x slower",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
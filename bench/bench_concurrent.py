@@ -0,0 +1,113 @@
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from char_array_list import CharArrayList  # noqa: E402
+from char_concurrent_list import ConcurrentCharList  # noqa: E402
+from char_doubly_linked_list import CharDoublyLinkedList  # noqa: E402
+
+DEFAULT_THREADS = [1, 2, 4, 8]
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+LIST_CLASSES = {
+    "array": CharArrayList,
+    "linked": CharDoublyLinkedList,
+}
+
+
+def _worker(lst, ops, read_ratio, seed, barrier):
+    rng = random.Random(seed)
+    barrier.wait()
+    for _ in range(ops):
+        choice = rng.random()
+        if choice < read_ratio:
+            size = lst.length()
+            if size:
+                lst.get(rng.randrange(size))
+        elif choice < read_ratio + (1 - read_ratio) / 2:
+            lst.append(rng.choice(ALPHABET))
+        else:
+            try:
+                lst.delete(0)
+            except IndexError:
+                pass
+
+
+def run_case(list_class, size, threads, ops, read_ratio, seed):
+    lst = ConcurrentCharList("x" * size, list_class)
+    barrier = threading.Barrier(threads + 1)
+    workers = [
+        threading.Thread(
+            target=_worker, args=(lst, ops, read_ratio, seed + number, barrier)
+        )
+        for number in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure ConcurrentCharList throughput as threads are added."
+    )
+    parser.add_argument("--threads", type=int, nargs="+", default=DEFAULT_THREADS)
+    parser.add_argument(
+        "--impl",
+        nargs="+",
+        choices=sorted(LIST_CLASSES),
+        default=list(LIST_CLASSES),
+    )
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument(
+        "--ops", type=int, default=20_000, help="Operations per thread."
+    )
+    parser.add_argument(
+        "--read-ratio",
+        type=float,
+        default=0.9,
+        help="Share of operations that are reads.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = []
+    for name in args.impl:
+        for threads in args.threads:
+            elapsed = run_case(
+                LIST_CLASSES[name],
+                args.size,
+                threads,
+                args.ops,
+                args.read_ratio,
+                args.seed,
+            )
+            throughput = threads * args.ops / elapsed
+            results.append(
+                {
+                    "implementation": name,
+                    "threads": threads,
+                    "ops": threads * args.ops,
+                    "seconds": elapsed,
+                    "ops_per_second": throughput,
+                }
+            )
+            print(
+                f"{name:>8} threads={threads:<3} {throughput:14.0f} ops/s",
+                file=sys.stderr,
+            )
+    print(json.dumps({"read_ratio": args.read_ratio, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from char_doubly_linked_list import CharDoublyLinkedList  # noqa: E402
+
+
+class _LegacyNode:
+    def __init__(self, data, prev_node=None, next_node=None):
+        self.data = data
+        self.prev = prev_node
+        self.next = next_node
+
+
+def _build_legacy_chain(text):
+    head = tail = None
+    for char_element in text:
+        node = _LegacyNode(char_element, tail)
+        if tail is None:
+            head = node
+        else:
+            tail.next = node
+        tail = node
+    return head
+
+
+def measure_build(size):
+    text = "abcdefghij" * (size // 10)
+    results = {}
+    for label, build in (
+        ("legacy_dict_nodes", _build_legacy_chain),
+        ("slotted_nodes", CharDoublyLinkedList.from_string),
+    ):
+        gc.collect()
+        tracemalloc.start()
+        structure = build(text)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[label] = {
+            "bytes": current,
+            "peak_bytes": peak,
+            "bytes_per_char": round(current / len(text), 1),
+        }
+        del structure
+    return results
+
+
+def measure_churn(size, rounds, node_pool_size):
+    lst = CharDoublyLinkedList("x" * size, node_pool_size=node_pool_size)
+    gc.collect()
+    collections_before = sum(stat["collections"] for stat in gc.get_stats())
+    tracemalloc.start()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for _ in range(size // 2):
+            lst.delete(lst.length() - 1)
+        for _ in range(size // 2):
+            lst.append("y")
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    collections_after = sum(stat["collections"] for stat in gc.get_stats())
+    return {
+        "node_pool_size": node_pool_size,
+        "seconds": round(elapsed, 4),
+        "peak_bytes": peak,
+        "gc_collections": collections_after - collections_before,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare linked list node memory before and after __slots__ and pooling."
+    )
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    report = {
+        "size": args.size,
+        "build": measure_build(args.size),
+        "churn": [
+            measure_churn(args.size, args.rounds, 0),
+            measure_churn(args.size, args.rounds, args.size),
+        ],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
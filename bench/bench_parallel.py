@@ -0,0 +1,101 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from char_array_list import CharArrayList, STORAGE_COMPACT, STORAGE_LIST  # noqa: E402
+from char_parallel import ParallelSearch  # noqa: E402
+
+DEFAULT_SIZES = [1 << 20, 1 << 22, 1 << 24]
+
+STORAGES = {
+    "list": (STORAGE_LIST, "x"),
+    "compact": (STORAGE_COMPACT, "x"),
+    "compact_wide": (STORAGE_COMPACT, "ω"),
+}
+
+
+def _serial(lst, operation):
+    if operation == "findFirst":
+        return lst.findFirst("a")
+    if operation == "findLast":
+        return lst.findLast("a")
+    return lst.deleteAll("a")
+
+
+def _parallel(search, lst, operation):
+    if operation == "findFirst":
+        return search.find_first(lst, "a")
+    if operation == "findLast":
+        return search.find_last(lst, "a")
+    return search.delete_all(lst, "a")
+
+
+def run_case(make_list, run, repeat):
+    elapsed = float("inf")
+    for _ in range(repeat):
+        lst = make_list()
+        started = time.perf_counter()
+        run(lst)
+        elapsed = min(elapsed, time.perf_counter() - started)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare ParallelSearch with the serial CharArrayList methods."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--storage",
+        nargs="+",
+        choices=sorted(STORAGES),
+        default=list(STORAGES),
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = []
+    with ParallelSearch(max_workers=args.workers, threshold=0) as search:
+        for size in args.sizes:
+            for name in args.storage:
+                storage, filler = STORAGES[name]
+                half = filler * (size // 2)
+                text = half + "a" + half
+
+                def make_list():
+                    return CharArrayList.from_string(text, storage=storage)
+
+                for operation in ("findFirst", "findLast", "deleteAll"):
+                    serial = run_case(
+                        make_list, lambda lst: _serial(lst, operation), args.repeat
+                    )
+                    parallel = run_case(
+                        make_list,
+                        lambda lst: _parallel(search, lst, operation),
+                        args.repeat,
+                    )
+                    results.append(
+                        {
+                            "storage": name,
+                            "operation": operation,
+                            "size": size,
+                            "serial_seconds": serial,
+                            "parallel_seconds": parallel,
+                        }
+                    )
+                    print(
+                        f"{name:>12} {operation:>9} n={size:<9} "
+                        f"serial {serial * 1e3:9.2f} ms  "
+                        f"parallel {parallel * 1e3:9.2f} ms",
+                        file=sys.stderr,
+                    )
+    print(json.dumps({"workers": args.workers, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import argparse
+import gc
+import json
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from char_array_list import CharArrayList  # noqa: E402
+from char_doubly_linked_list import CharDoublyLinkedList  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+IMPLEMENTATIONS = {
+    "array": CharArrayList.from_string,
+    "linked": CharDoublyLinkedList.from_string,
+}
+
+
+def _default_round_trip(lst):
+    data = pickle.dumps(vars(lst), protocol=pickle.HIGHEST_PROTOCOL)
+    pickle.loads(data)
+    return len(data)
+
+
+def _reduce_round_trip(lst):
+    data = pickle.dumps(lst, protocol=pickle.HIGHEST_PROTOCOL)
+    pickle.loads(data)
+    return len(data)
+
+
+def _bytes_round_trip(lst):
+    data = lst.to_bytes()
+    type(lst).from_bytes(data)
+    return len(data)
+
+
+METHODS = {
+    "default_pickle": _default_round_trip,
+    "pickle": _reduce_round_trip,
+    "to_bytes": _bytes_round_trip,
+}
+
+
+def run_case(lst, method, repeat):
+    elapsed = float("inf")
+    size = None
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        try:
+            size = METHODS[method](lst)
+        except RecursionError:
+            return None, None
+        elapsed = min(elapsed, time.perf_counter() - started)
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare CharList serialization round trips with default pickling."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--impl",
+        nargs="+",
+        choices=sorted(IMPLEMENTATIONS),
+        default=list(IMPLEMENTATIONS),
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        text = "abcdefghij" * (size // 10)
+        for name in args.impl:
+            lst = IMPLEMENTATIONS[name](text)
+            for method in METHODS:
+                elapsed, payload_bytes = run_case(lst, method, args.repeat)
+                results.append(
+                    {
+                        "implementation": name,
+                        "method": method,
+                        "size": size,
+                        "seconds": elapsed,
+                        "payload_bytes": payload_bytes,
+                    }
+                )
+                timing = "RecursionError" if elapsed is None else f"{elapsed:.4f} s"
+                print(
+                    f"{name:>7} {method:>15} n={size:<8} {timing:>15}  "
+                    f"bytes={payload_bytes}",
+                    file=sys.stderr,
+                )
+    print(json.dumps({"results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
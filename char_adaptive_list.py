@@ -0,0 +1,240 @@
+from typing import Any, Dict, Iterator, List as PyList, Union
+
+from char_array_list import CharArrayList
+from char_doubly_linked_list import CharDoublyLinkedList
+from char_gap_buffer_list import CharGapBufferList
+from char_list_batch import EditBatch
+
+REPRESENTATION_ARRAY = "array"
+REPRESENTATION_LINKED = "linked"
+REPRESENTATION_GAP = "gap"
+
+REPRESENTATIONS = {
+    REPRESENTATION_ARRAY: CharArrayList,
+    REPRESENTATION_GAP: CharGapBufferList,
+    REPRESENTATION_LINKED: CharDoublyLinkedList,
+}
+
+WINDOW = 256
+SWITCH_RATIO = 2.0
+MIGRATION_WEIGHT = 0.05
+
+_MOVE_COST = 0.02
+
+
+class CharAdaptiveList:
+
+    _reads_mutate: bool = True
+
+    def __init__(
+        self,
+        initial_elements: Union[PyList[str], str, None] = None,
+        representation: str = REPRESENTATION_ARRAY,
+        window: int = WINDOW,
+        switch_ratio: float = SWITCH_RATIO,
+        migration_weight: float = MIGRATION_WEIGHT,
+    ):
+        if representation not in REPRESENTATIONS:
+            raise ValueError(
+                f"Unknown representation '{representation}'. "
+                f"Expected one of {sorted(REPRESENTATIONS)}."
+            )
+        if not isinstance(window, int) or window < 1:
+            raise ValueError("Window must be a positive integer.")
+        if switch_ratio < 1:
+            raise ValueError("Switch ratio must be at least 1.")
+        if migration_weight < 0:
+            raise ValueError("Migration weight must not be negative.")
+        self._representation: str = representation
+        self._list: Any = REPRESENTATIONS[representation](initial_elements)
+        self._window: int = window
+        self._switch_ratio: float = switch_ratio
+        self._migration_weight: float = migration_weight
+        self._operations: int = 0
+        self._costs: Dict[str, float] = dict.fromkeys(REPRESENTATIONS, 0.0)
+        self._last_access: int = 0
+        self._last_edit: int = 0
+        self._migrations: int = 0
+
+    @classmethod
+    def from_string(cls, text: str, **options: Any) -> "CharAdaptiveList":
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        return cls(text, **options)
+
+    def _options(self) -> Dict[str, Any]:
+        return {
+            "representation": self._representation,
+            "window": self._window,
+            "switch_ratio": self._switch_ratio,
+            "migration_weight": self._migration_weight,
+        }
+
+    @property
+    def representation(self) -> str:
+        return self._representation
+
+    @property
+    def migrations(self) -> int:
+        return self._migrations
+
+    def _observe_access(self, index: int, edit: bool) -> None:
+        size = self._list.length()
+        costs = self._costs
+        costs[REPRESENTATION_ARRAY] += 1.0 + (
+            _MOVE_COST * (size - index) if edit else 0.0
+        )
+        costs[REPRESENTATION_LINKED] += 1.0 + min(
+            index, max(size - index, 0), abs(index - self._last_access)
+        )
+        costs[REPRESENTATION_GAP] += 1.0 + (
+            _MOVE_COST * abs(index - self._last_edit) if edit else 0.0
+        )
+        self._last_access = index
+        if edit:
+            self._last_edit = index
+        self._count_operation()
+
+    def _observe_scan(self) -> None:
+        size = self._list.length()
+        for representation in self._costs:
+            if representation == REPRESENTATION_LINKED:
+                self._costs[representation] += 1.0 + size
+            else:
+                self._costs[representation] += 1.0 + _MOVE_COST * size
+        self._count_operation()
+
+    def _count_operation(self) -> None:
+        self._operations += 1
+        if self._operations >= self._window:
+            self._reconsider()
+
+    def _reconsider(self) -> None:
+        costs = self._costs
+        current_cost = costs[self._representation]
+        best = min(costs, key=costs.__getitem__)
+        savings = current_cost - costs[best]
+        if (
+            best != self._representation
+            and current_cost > self._switch_ratio * costs[best]
+            and savings > self._migration_weight * self._list.length()
+        ):
+            self.migrate(best)
+        self._operations = 0
+        self._costs = dict.fromkeys(REPRESENTATIONS, 0.0)
+
+    def migrate(self, representation: str) -> None:
+        if representation not in REPRESENTATIONS:
+            raise ValueError(
+                f"Unknown representation '{representation}'. "
+                f"Expected one of {sorted(REPRESENTATIONS)}."
+            )
+        if representation == self._representation:
+            return
+        text = self._list.to_string()
+        self._list = REPRESENTATIONS[representation].from_string(text)
+        self._representation = representation
+        self._last_edit = self._list.length()
+        self._migrations += 1
+
+    def length(self) -> int:
+        return self._list.length()
+
+    def append(self, element: str) -> None:
+        self._list.append(element)
+        self._observe_access(self._list.length() - 1, edit=True)
+
+    def insert(self, element: str, index: int) -> None:
+        self._list.insert(element, index)
+        self._observe_access(index, edit=True)
+
+    def delete(self, index: int) -> str:
+        deleted_data = self._list.delete(index)
+        self._observe_access(index, edit=True)
+        return deleted_data
+
+    def deleteAll(self, element: str) -> None:
+        self._list.deleteAll(element)
+        self._observe_scan()
+
+    def get(self, index: int) -> str:
+        char_element = self._list.get(index)
+        self._observe_access(index, edit=False)
+        return char_element
+
+    def clone(self) -> "CharAdaptiveList":
+        new_list = CharAdaptiveList(**self._options())
+        new_list._list = self._list.clone()
+        return new_list
+
+    def reverse(self) -> None:
+        self._list.reverse()
+
+    def findFirst(self, element: str) -> int:
+        index = self._list.findFirst(element)
+        self._observe_scan()
+        return index
+
+    def findLast(self, element: str) -> int:
+        index = self._list.findLast(element)
+        self._observe_scan()
+        return index
+
+    def count(self, element: str) -> int:
+        occurrences = self._list.count(element)
+        self._observe_scan()
+        return occurrences
+
+    def find_all(self, element: str) -> PyList[int]:
+        positions = self._list.find_all(element)
+        self._observe_scan()
+        return positions
+
+    def find_substring(self, pattern: str) -> int:
+        position = self._list.find_substring(pattern)
+        self._observe_scan()
+        return position
+
+    def clear(self) -> None:
+        self._list.clear()
+        self._last_access = 0
+        self._last_edit = 0
+
+    def extend(self, elements: "CharAdaptiveList") -> None:
+        if not isinstance(elements, CharAdaptiveList):
+            raise TypeError("Argument must be an instance of CharAdaptiveList.")
+        self._list.extend_from_str(elements.to_string())
+
+    def extend_from_str(self, text: str) -> None:
+        self._list.extend_from_str(text)
+
+    def batch(self) -> "EditBatch":
+        return EditBatch(self)
+
+    def to_string(self) -> str:
+        return self._list.to_string()
+
+    def __len__(self) -> int:
+        return self._list.length()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._list)
+
+    def __contains__(self, element: object) -> bool:
+        return element in self._list
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, "CharAdaptiveList"]:
+        if isinstance(index, slice):
+            new_list = CharAdaptiveList(**self._options())
+            new_list._list = self._list[index]
+            return new_list
+        return self._list[index]
+
+    def __str__(self) -> str:
+        return f"CharAdaptiveList([{', '.join(repr(char) for char in self)}])"
+
+    def __repr__(self) -> str:
+        return (
+            f"CharAdaptiveList(elements={self.to_string()!r}, size={self.length()}, "
+            f"representation={self._representation!r})"
+        )
@@ -1,28 +1,262 @@
-from typing import List as PyList, Union
+import sys
+import weakref
+from array import array
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List as PyList,
+    Tuple,
+    Union,
+)
+
+from char_list_batch import EditBatch
+from char_list_codec import ENCODING_UTF8, decode, encode
+from char_list_io import (
+    ASYNC_CHUNK_SIZE,
+    CHUNK_SIZE,
+    aread_chunks,
+    ayield_chunks,
+    is_latin1,
+    read_chunks,
+    read_mapped_bytes,
+    validate_chunk_size,
+    write_chunks,
+)
+from char_search import find_all, validate_pattern
+
+STORAGE_LIST = "list"
+STORAGE_COMPACT = "compact"
+
+_WIDE_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+_WIDE_ENCODING = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+_LATIN1_MAX = 0xFF
+
+
+def _release_share(state: Dict[str, Any]) -> None:
+    share_count = state["_share_count"]
+    if share_count[0] > 1:
+        share_count[0] -= 1
+
+
+class _CompactStorage:
+    __slots__ = ("_buf",)
+
+    def __init__(self, text: str = ""):
+        self._buf: Union[bytearray, array] = bytearray()
+        self.extend_str(text)
+
+    @property
+    def is_wide(self) -> bool:
+        return not isinstance(self._buf, bytearray)
+
+    def _widen(self) -> None:
+        if not self.is_wide:
+            wide_buf = array(_WIDE_TYPECODE)
+            wide_buf.frombytes(self._buf.decode("latin-1").encode(_WIDE_ENCODING))
+            self._buf = wide_buf
+
+    def _code_point(self, element: str) -> int:
+        code_point = ord(element)
+        if code_point > _LATIN1_MAX:
+            self._widen()
+        return code_point
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, "_CompactStorage"]:
+        if isinstance(index, slice):
+            new_storage = _CompactStorage()
+            new_storage._buf = self._buf[index]
+            return new_storage
+        return chr(self._buf[index])
+
+    def __iter__(self) -> Iterator[str]:
+        return map(chr, self._buf)
+
+    def __reversed__(self) -> Iterator[str]:
+        return map(chr, reversed(self._buf))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __contains__(self, element: str) -> bool:
+        code_point = ord(element)
+        if code_point > _LATIN1_MAX and not self.is_wide:
+            return False
+        return code_point in self._buf
+
+    def append(self, element: str) -> None:
+        code_point = self._code_point(element)
+        self._buf.append(code_point)
+
+    def insert(self, index: int, element: str) -> None:
+        code_point = self._code_point(element)
+        self._buf.insert(index, code_point)
+
+    def pop(self, index: int) -> str:
+        return chr(self._buf.pop(index))
+
+    def index(self, element: str) -> int:
+        code_point = ord(element)
+        if code_point > _LATIN1_MAX and not self.is_wide:
+            raise ValueError(f"{element!r} is not in storage")
+        return self._buf.index(code_point)
+
+    def rfind(self, element: str) -> int:
+        if self.is_wide:
+            return self.to_str().rfind(element)
+        code_point = ord(element)
+        if code_point > _LATIN1_MAX:
+            return -1
+        return self._buf.rfind(code_point)
+
+    def count(self, element: str) -> int:
+        code_point = ord(element)
+        if code_point > _LATIN1_MAX and not self.is_wide:
+            return 0
+        return self._buf.count(code_point)
+
+    def find_all(self, element: str) -> PyList[int]:
+        if self.is_wide:
+            return find_all(self.to_str(), element)
+        code_point = ord(element)
+        if code_point > _LATIN1_MAX:
+            return []
+        positions = []
+        position = self._buf.find(code_point)
+        while position != -1:
+            positions.append(position)
+            position = self._buf.find(code_point, position + 1)
+        return positions
+
+    def find(self, pattern: str) -> int:
+        if self.is_wide:
+            return self.to_str().find(pattern)
+        try:
+            return self._buf.find(pattern.encode("latin-1"))
+        except UnicodeEncodeError:
+            return -1
+
+    def remove_all(self, element: str) -> None:
+        if self.is_wide:
+            remaining = self.to_str().replace(element, "")
+            self._buf = array(_WIDE_TYPECODE)
+            self._buf.frombytes(remaining.encode(_WIDE_ENCODING, "surrogatepass"))
+        elif ord(element) <= _LATIN1_MAX:
+            self._buf = self._buf.replace(bytes((ord(element),)), b"")
+
+    def reverse(self) -> None:
+        self._buf.reverse()
+
+    def copy(self) -> "_CompactStorage":
+        new_storage = _CompactStorage()
+        new_storage._buf = self._buf[:]
+        return new_storage
+
+    def extend_str(self, text: str) -> None:
+        if not self.is_wide:
+            try:
+                self._buf += text.encode("latin-1")
+                return
+            except UnicodeEncodeError:
+                self._widen()
+        self._buf.frombytes(text.encode(_WIDE_ENCODING, "surrogatepass"))
+
+    @property
+    def encoding(self) -> str:
+        return _WIDE_ENCODING if self.is_wide else "latin-1"
+
+    def to_str(self) -> str:
+        if self.is_wide:
+            return self._buf.tobytes().decode(_WIDE_ENCODING, "surrogatepass")
+        return self._buf.decode("latin-1")
 
 
 class CharArrayList:
 
-    def __init__(self, initial_elements: Union[PyList[str], str, None] = None):
-        self._data: PyList[str] = []
+    def __init__(
+        self,
+        initial_elements: Union[PyList[str], str, None] = None,
+        storage: str = STORAGE_LIST,
+    ):
+        self._data: Union[PyList[str], _CompactStorage]
+        if storage == STORAGE_LIST:
+            self._data = []
+        elif storage == STORAGE_COMPACT:
+            self._data = _CompactStorage()
+        else:
+            raise ValueError(
+                f"Unknown storage '{storage}'. Expected '{STORAGE_LIST}' or '{STORAGE_COMPACT}'."
+            )
+        self._storage: str = storage
+        self._share_count: PyList[int] = [1]
+        self._share_tracked: bool = False
+        self._reversed: bool = False
         if initial_elements:
             if isinstance(initial_elements, str):
-                for char_element in initial_elements:
-                    self.append(char_element)
+                self._extend_text(initial_elements)
             elif isinstance(initial_elements, list):
-                for char_element in initial_elements:
-                    self.append(char_element)
+                self._extend_text(self._validate_chars(initial_elements))
             else:
                 raise TypeError(
                     "Initial elements must be a list of characters or a string."
                 )
 
+    @classmethod
+    def from_string(cls, text: str, storage: str = STORAGE_LIST) -> "CharArrayList":
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        new_list = cls(storage=storage)
+        new_list._extend_text(text)
+        return new_list
+
+    @classmethod
+    def from_bytes(
+        cls, data: Union[bytes, bytearray, memoryview], storage: str = STORAGE_LIST
+    ) -> "CharArrayList":
+        return cls.from_string(decode(data), storage=storage)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        encoding: str = "utf-8",
+        storage: str = STORAGE_LIST,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> "CharArrayList":
+        validate_chunk_size(chunk_size)
+        new_list = cls(storage=storage)
+        if storage == STORAGE_COMPACT and is_latin1(encoding):
+            new_list._data._buf = read_mapped_bytes(path)
+            return new_list
+        for chunk in read_chunks(path, encoding, chunk_size):
+            new_list._extend_text(chunk)
+        return new_list
+
+    @property
+    def storage(self) -> str:
+        return self._storage
+
     def _validate_char(self, element: str) -> None:
         if not isinstance(element, str) or len(element) != 1:
             raise TypeError(
                 f"Element '{element}' must be a single character (str of length 1)."
             )
 
+    def _validate_chars(self, elements: PyList[str]) -> str:
+        try:
+            text = "".join(elements)
+        except TypeError:
+            text = ""
+        if len(text) != len(elements) or len(set(map(len, elements))) > 1:
+            for element in elements:
+                self._validate_char(element)
+        return text
+
     def _validate_index(self, index: int, for_insertion: bool = False) -> None:
         if not isinstance(index, int):
             raise TypeError("Index must be an integer.")
@@ -40,68 +274,279 @@ class CharArrayList:
                     f"Index {index} out of bounds. Valid range is 0 to {current_length - 1}."
                 )
 
+    def _track_share(self) -> None:
+        if not self._share_tracked:
+            self._share_tracked = True
+            weakref.finalize(self, _release_share, vars(self))
+
+    def _detach(self) -> None:
+        if self._share_count[0] > 1:
+            self._share_count[0] -= 1
+            self._share_count = [1]
+
+    def _ensure_owned(self) -> None:
+        if self._share_count[0] > 1:
+            self._detach()
+            self._data = self._data.copy()
+
+    def _physical_index(self, index: int) -> int:
+        return len(self._data) - 1 - index if self._reversed else index
+
+    def _physical_text(self) -> str:
+        if isinstance(self._data, _CompactStorage):
+            return self._data.to_str()
+        return "".join(self._data)
+
+    def _physical_find(self, element: str) -> int:
+        try:
+            return self._data.index(element)
+        except ValueError:
+            return -1
+
+    def _physical_rfind(self, element: str) -> int:
+        if isinstance(self._data, _CompactStorage):
+            return self._data.rfind(element)
+        return self._physical_text().rfind(element)
+
+    def materialize(self) -> None:
+        if self._reversed:
+            self._ensure_owned()
+            self._data.reverse()
+            self._reversed = False
+
+    @property
+    def is_reversed(self) -> bool:
+        return self._reversed
+
     def length(self) -> int:
         return len(self._data)
 
     def append(self, element: str) -> None:
         self._validate_char(element)
+        self.materialize()
+        self._ensure_owned()
         self._data.append(element)
 
     def insert(self, element: str, index: int) -> None:
         self._validate_char(element)
         self._validate_index(index, for_insertion=True)
+        self._ensure_owned()
+        if self._reversed:
+            index = len(self._data) - index
         self._data.insert(index, element)
 
     def delete(self, index: int) -> str:
         if self.length() == 0:
             raise IndexError("Cannot delete from an empty list.")
         self._validate_index(index)
-        return self._data.pop(index)
+        self._ensure_owned()
+        return self._data.pop(self._physical_index(index))
 
     def deleteAll(self, element: str) -> None:
         self._validate_char(element)
-        self._data = [item for item in self._data if item != element]
+        if element not in self._data:
+            return
+        if isinstance(self._data, _CompactStorage):
+            self._ensure_owned()
+            self._data.remove_all(element)
+        else:
+            self._detach()
+            self._data = list("".join(self._data).replace(element, ""))
 
     def get(self, index: int) -> str:
         if self.length() == 0:
             raise IndexError("Cannot get from an empty list.")
         self._validate_index(index)
-        return self._data[index]
+        return self._data[self._physical_index(index)]
 
     def clone(self) -> "CharArrayList":
-        new_list = CharArrayList()
-        for item in self._data:
-            new_list.append(item)
+        new_list = CharArrayList(storage=self._storage)
+        new_list._data = self._data
+        new_list._share_count = self._share_count
+        new_list._reversed = self._reversed
+        self._share_count[0] += 1
+        self._track_share()
+        new_list._track_share()
         return new_list
 
     def reverse(self) -> None:
-        self._data.reverse()
+        self._reversed = not self._reversed
 
     def findFirst(self, element: str) -> int:
         self._validate_char(element)
-        try:
-            return self._data.index(element)
-        except ValueError:
-            return -1
+        if self._reversed:
+            position = self._physical_rfind(element)
+            return position if position == -1 else self._physical_index(position)
+        return self._physical_find(element)
 
     def findLast(self, element: str) -> int:
         self._validate_char(element)
-        for i in range(self.length() - 1, -1, -1):
-            if self._data[i] == element:
-                return i
-        return -1
+        if self._reversed:
+            position = self._physical_find(element)
+            return position if position == -1 else self._physical_index(position)
+        return self._physical_rfind(element)
+
+    def count(self, element: str) -> int:
+        self._validate_char(element)
+        return self._data.count(element)
+
+    def find_all(self, element: str) -> PyList[int]:
+        self._validate_char(element)
+        if isinstance(self._data, _CompactStorage):
+            positions = self._data.find_all(element)
+        else:
+            positions = find_all(self._physical_text(), element)
+        if self._reversed:
+            last_index = len(self._data) - 1
+            positions = [last_index - position for position in reversed(positions)]
+        return positions
+
+    def find_substring(self, pattern: str) -> int:
+        validate_pattern(pattern)
+        if self._reversed:
+            return self.to_string().find(pattern)
+        if isinstance(self._data, _CompactStorage):
+            return self._data.find(pattern)
+        return self._physical_text().find(pattern)
 
     def clear(self) -> None:
-        self._data = []
+        self._detach()
+        self._reversed = False
+        if isinstance(self._data, _CompactStorage):
+            self._data = _CompactStorage()
+        else:
+            self._data = []
 
     def extend(self, elements: "CharArrayList") -> None:
         if not isinstance(elements, CharArrayList):
             raise TypeError("Argument must be an instance of CharArrayList.")
-        for i in range(elements.length()):
-            self.append(elements.get(i))
+        if (
+            isinstance(self._data, list)
+            and isinstance(elements._data, list)
+            and not elements._reversed
+        ):
+            source_data = elements._data
+            self.materialize()
+            self._ensure_owned()
+            self._data.extend(source_data)
+        else:
+            text = elements.to_string()
+            self.materialize()
+            self._ensure_owned()
+            self._extend_text(text)
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        self.materialize()
+        self._ensure_owned()
+        self._extend_text(text)
+
+    def _extend_text(self, text: str) -> None:
+        if isinstance(self._data, _CompactStorage):
+            self._data.extend_str(text)
+        else:
+            self._data.extend(text)
+
+    def batch(self) -> "EditBatch":
+        return EditBatch(self)
+
+    def to_string(self) -> str:
+        text = self._physical_text()
+        return text[::-1] if self._reversed else text
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+        validate_chunk_size(chunk_size)
+        size = len(self._data)
+        for start in range(0, size, chunk_size):
+            if self._reversed:
+                stop = size - start
+                piece = self._data[max(stop - chunk_size, 0) : stop]
+            else:
+                piece = self._data[start : start + chunk_size]
+            if isinstance(piece, _CompactStorage):
+                text = piece.to_str()
+            else:
+                text = "".join(piece)
+            yield text[::-1] if self._reversed else text
+
+    def write_to(self, fileobj: IO[str], chunk_size: int = CHUNK_SIZE) -> int:
+        return write_chunks(fileobj, self.iter_chunks(chunk_size))
+
+    async def aextend_from(
+        self,
+        reader: Any,
+        encoding: str = "utf-8",
+        chunk_size: int = ASYNC_CHUNK_SIZE,
+    ) -> int:
+        return await aread_chunks(reader, self.extend_from_str, encoding, chunk_size)
+
+    def aiter_chunks(self, chunk_size: int = ASYNC_CHUNK_SIZE) -> AsyncIterator[str]:
+        return ayield_chunks(self.iter_chunks(chunk_size))
+
+    def to_bytes(self, encoding: str = ENCODING_UTF8) -> bytes:
+        return encode(self.to_string(), encoding)
+
+    def __getstate__(self) -> Dict[str, bytes]:
+        return {"payload": self.to_bytes()}
+
+    def __setstate__(self, state: Dict[str, bytes]) -> None:
+        self.clear()
+        self._extend_text(decode(state["payload"]))
+
+    def __reduce__(self) -> Tuple[type, Tuple[None, str], Dict[str, bytes]]:
+        return type(self), (None, self._storage), self.__getstate__()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[str]:
+        return reversed(self._data) if self._reversed else iter(self._data)
+
+    def __contains__(self, element: object) -> bool:
+        if not isinstance(element, str) or len(element) != 1:
+            return False
+        return self.findFirst(element) != -1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, "CharArrayList"]:
+        if isinstance(index, slice):
+            new_list = CharArrayList(storage=self._storage)
+            if not self._reversed:
+                new_list._data = self._data[index]
+                return new_list
+            start, stop, step = index.indices(len(self._data))
+            if step == 1:
+                stop = max(start, stop)
+                physical_end = len(self._data) - start
+                new_list._data = self._data[
+                    physical_end - (stop - start) : physical_end
+                ]
+                new_list._reversed = True
+            else:
+                new_list._data = self._data[::-1][index]
+            return new_list
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer or a slice.")
+        if index < 0:
+            index += len(self._data)
+        if not (0 <= index < len(self._data)):
+            raise IndexError(f"Index {index} out of bounds.")
+        return self._data[self._physical_index(index)]
+
+    def as_buffer(self) -> memoryview:
+        if not isinstance(self._data, _CompactStorage):
+            raise TypeError("Buffer export requires compact storage.")
+        self.materialize()
+        return memoryview(self._data._buf).toreadonly()
+
+    @property
+    def buffer_encoding(self) -> str:
+        if not isinstance(self._data, _CompactStorage):
+            raise TypeError("Buffer export requires compact storage.")
+        return self._data.encoding
 
     def __str__(self) -> str:
-        return f"CharArrayList([{', '.join(repr(char) for char in self._data)}])"
+        return f"CharArrayList([{', '.join(repr(char) for char in self)}])"
 
     def __repr__(self) -> str:
-        return f"CharArrayList({self._data})"
+        return f"CharArrayList({list(self)})"
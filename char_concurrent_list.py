@@ -0,0 +1,219 @@
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterator, List as PyList, Optional, Union
+
+from char_array_list import CharArrayList
+from char_list_batch import EditBatch
+from char_rope_list import CharRopeList
+
+
+class ReadWriteLock:
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers: int = 0
+        self._writer: bool = False
+        self._waiting_writers: int = 0
+
+    def acquire_read(self) -> None:
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class _LockedEditBatch(EditBatch):
+
+    def __init__(self, owner: "ConcurrentCharList"):
+        super().__init__(owner._list)
+        self._owner = owner
+
+    def commit(self) -> None:
+        with self._owner._writing():
+            super().commit()
+
+
+class ConcurrentCharList:
+
+    def __init__(
+        self,
+        initial_elements: Union[PyList[str], str, None] = None,
+        list_class: Callable[..., object] = CharArrayList,
+    ):
+        self._list_class = list_class
+        self._list = list_class(initial_elements)
+        self._lock = ReadWriteLock()
+        self._snapshot: Optional[CharRopeList] = None
+        self._read_mutex = (
+            threading.Lock()
+            if getattr(self._list, "_reads_mutate", False)
+            else nullcontext()
+        )
+
+    @classmethod
+    def from_string(
+        cls, text: str, list_class: Callable[..., object] = CharArrayList
+    ) -> "ConcurrentCharList":
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        return cls(text, list_class)
+
+    def _adopt(self, inner: object) -> "ConcurrentCharList":
+        new_list = ConcurrentCharList(list_class=self._list_class)
+        new_list._list = inner
+        return new_list
+
+    @contextmanager
+    def _reading(self) -> Iterator[None]:
+        with self._lock.read_locked(), self._read_mutex:
+            yield
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        with self._lock.write_locked():
+            try:
+                yield
+            finally:
+                self._snapshot = None
+
+    def length(self) -> int:
+        with self._reading():
+            return self._list.length()
+
+    def append(self, element: str) -> None:
+        with self._writing():
+            self._list.append(element)
+
+    def insert(self, element: str, index: int) -> None:
+        with self._writing():
+            self._list.insert(element, index)
+
+    def delete(self, index: int) -> str:
+        with self._writing():
+            return self._list.delete(index)
+
+    def deleteAll(self, element: str) -> None:
+        with self._writing():
+            self._list.deleteAll(element)
+
+    def get(self, index: int) -> str:
+        with self._reading():
+            return self._list.get(index)
+
+    def clone(self) -> "ConcurrentCharList":
+        return ConcurrentCharList(self.to_string(), self._list_class)
+
+    def reverse(self) -> None:
+        with self._writing():
+            self._list.reverse()
+
+    def findFirst(self, element: str) -> int:
+        with self._reading():
+            return self._list.findFirst(element)
+
+    def findLast(self, element: str) -> int:
+        with self._reading():
+            return self._list.findLast(element)
+
+    def count(self, element: str) -> int:
+        with self._reading():
+            return self._list.count(element)
+
+    def find_all(self, element: str) -> PyList[int]:
+        with self._reading():
+            return self._list.find_all(element)
+
+    def find_substring(self, pattern: str) -> int:
+        with self._reading():
+            return self._list.find_substring(pattern)
+
+    def clear(self) -> None:
+        with self._writing():
+            self._list.clear()
+
+    def extend(self, elements: "ConcurrentCharList") -> None:
+        if not isinstance(elements, ConcurrentCharList):
+            raise TypeError("Argument must be an instance of ConcurrentCharList.")
+        self.extend_from_str(elements.to_string())
+
+    def extend_from_str(self, text: str) -> None:
+        with self._writing():
+            self._list.extend_from_str(text)
+
+    def batch(self) -> EditBatch:
+        return _LockedEditBatch(self)
+
+    def to_string(self) -> str:
+        with self._reading():
+            return self._list.to_string()
+
+    def snapshot(self) -> CharRopeList:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._reading():
+                snapshot = self._snapshot
+                if snapshot is None:
+                    if isinstance(self._list, CharRopeList):
+                        snapshot = CharRopeList.clone(self._list)
+                    else:
+                        snapshot = CharRopeList.from_string(self._list.to_string())
+                    self._snapshot = snapshot
+        return snapshot.clone()
+
+    def __len__(self) -> int:
+        return self.length()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __contains__(self, element: object) -> bool:
+        with self._reading():
+            return element in self._list
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, "ConcurrentCharList"]:
+        with self._reading():
+            item = self._list[index]
+        if isinstance(index, slice):
+            return self._adopt(item)
+        return item
+
+    def __str__(self) -> str:
+        return f"ConcurrentCharList({self.snapshot().to_string()!r})"
+
+    def __repr__(self) -> str:
+        return f"ConcurrentCharList(elements={self.to_string()!r}, list={type(self._list).__name__})"
@@ -1,8 +1,42 @@
-from typing import Optional, Union, List as PyList
+import weakref
+from itertools import islice
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+    List as PyList,
+)
+
+from char_list_batch import EditBatch
+from char_list_codec import ENCODING_UTF8, decode, encode
+from char_list_io import (
+    ASYNC_CHUNK_SIZE,
+    CHUNK_SIZE,
+    aread_chunks,
+    ayield_chunks,
+    read_chunks,
+    validate_chunk_size,
+    write_chunks,
+)
+from char_search import find_all, validate_pattern
+
+
+def _release_share(state: Dict[str, Any]) -> None:
+    share_count = state["_share_count"]
+    if share_count[0] > 1:
+        share_count[0] -= 1
 
 
 class CharDoublyLinkedList:
     class _Node:
+        __slots__ = ("data", "prev", "next")
+
         def __init__(
             self,
             data: str,
@@ -16,28 +50,174 @@ class CharDoublyLinkedList:
         def __repr__(self) -> str:
             return f"Node({self.data})"
 
-    def __init__(self, initial_elements: Union[PyList[str], str, None] = None):
+    class Cursor:
+        def __init__(self, owner: "CharDoublyLinkedList", index: int = 0):
+            owner._validate_index(index, for_insertion=True)
+            self._owner = owner
+            self._index: int = index
+            self._node: Optional[CharDoublyLinkedList._Node] = owner._node_or_end(index)
+            self._version: int = owner._version
+
+        def _check_valid(self) -> None:
+            if self._version != self._owner._version:
+                raise RuntimeError(
+                    "Cursor is no longer valid: the list was modified through another path."
+                )
+
+        @property
+        def index(self) -> int:
+            self._check_valid()
+            return self._index
+
+        @property
+        def at_end(self) -> bool:
+            self._check_valid()
+            return self._node is None
+
+        def move(self, delta: int) -> None:
+            self._check_valid()
+            if not isinstance(delta, int):
+                raise TypeError("Delta must be an integer.")
+            owner = self._owner
+            target = self._index + delta
+            if not (0 <= target <= owner._size):
+                raise IndexError(
+                    f"Cannot move cursor to {target}. List length is {owner._size}."
+                )
+            node = self._node
+            if abs(delta) > min(target, owner._size - target):
+                node = owner._node_or_end(target)
+            elif delta > 0:
+                for _ in range(delta):
+                    node = owner._next_logical(node)
+            else:
+                for _ in range(-delta):
+                    node = (
+                        owner._logical_tail()
+                        if node is None
+                        else owner._prev_logical(node)
+                    )
+            self._node = node
+            self._index = target
+
+        def get(self) -> str:
+            self._check_valid()
+            if self._node is None:
+                raise IndexError("Cursor is at the end of the list.")
+            return self._node.data
+
+        def _prepare_mutation(self) -> None:
+            self._check_valid()
+            owner = self._owner
+            if owner._ensure_owned():
+                self._node = owner._node_or_end(self._index)
+                self._version = owner._version
+
+        def insert_here(self, element: str) -> None:
+            self._check_valid()
+            owner = self._owner
+            owner._validate_char(element)
+            self._prepare_mutation()
+            if self._node is None:
+                owner.append(element)
+            else:
+                owner._link_before_logical(self._node, element, self._index)
+            self._index += 1
+            self._version = owner._version
+
+        def delete_here(self) -> str:
+            self._check_valid()
+            if self._node is None:
+                raise IndexError("Cannot delete at the end of the list.")
+            self._prepare_mutation()
+            owner = self._owner
+            next_node = owner._next_logical(self._node)
+            deleted_data = owner._unlink(self._node, owner._physical_index(self._index))
+            self._node = next_node
+            self._version = self._owner._version
+            return deleted_data
+
+        def __iter__(self):
+            self._check_valid()
+            current = self._node
+            while current:
+                yield current.data
+                self._check_valid()
+                current = self._owner._next_logical(current)
+
+        def __repr__(self) -> str:
+            return f"Cursor(index={self._index}, node={self._node!r})"
+
+    _traversal_observer: Optional[Callable[[int], None]] = None
+    _reads_mutate: bool = True
+
+    def __init__(
+        self,
+        initial_elements: Union[PyList[str], str, None] = None,
+        node_pool_size: int = 0,
+    ):
+        if not isinstance(node_pool_size, int) or node_pool_size < 0:
+            raise ValueError("Node pool size must be a non-negative integer.")
         self.head: Optional[CharDoublyLinkedList._Node] = None
         self.tail: Optional[CharDoublyLinkedList._Node] = None
         self._size: int = 0
+        self._version: int = 0
+        self._finger_index: int = 0
+        self._finger_node: Optional[CharDoublyLinkedList._Node] = None
+        self._node_pool_size: int = node_pool_size
+        self._free_nodes: PyList[CharDoublyLinkedList._Node] = []
+        self._share_count: PyList[int] = [1]
+        self._share_tracked: bool = False
+        self._reversed: bool = False
         if initial_elements:
             if isinstance(initial_elements, str):
-                for char_element in initial_elements:
-                    self.append(char_element)
+                self._extend_text(initial_elements)
             elif isinstance(initial_elements, list):
-                for char_element in initial_elements:
-                    self.append(char_element)
+                self._extend_text(self._validate_chars(initial_elements))
             else:
                 raise TypeError(
                     "Initial elements must be a list of characters or a string."
                 )
 
+    @classmethod
+    def from_string(cls, text: str) -> "CharDoublyLinkedList":
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        new_list = cls()
+        new_list._extend_text(text)
+        return new_list
+
+    @classmethod
+    def from_bytes(
+        cls, data: Union[bytes, bytearray, memoryview]
+    ) -> "CharDoublyLinkedList":
+        return cls.from_string(decode(data))
+
+    @classmethod
+    def from_file(
+        cls, path: str, encoding: str = "utf-8", chunk_size: int = CHUNK_SIZE
+    ) -> "CharDoublyLinkedList":
+        new_list = cls()
+        for chunk in read_chunks(path, encoding, chunk_size):
+            new_list._extend_text(chunk)
+        return new_list
+
     def _validate_char(self, element: str) -> None:
         if not isinstance(element, str) or len(element) != 1:
             raise TypeError(
                 f"Element '{element}' must be a single character (str of length 1)."
             )
 
+    def _validate_chars(self, elements: PyList[str]) -> str:
+        try:
+            text = "".join(elements)
+        except TypeError:
+            text = ""
+        if len(text) != len(elements) or len(set(map(len, elements))) > 1:
+            for element in elements:
+                self._validate_char(element)
+        return text
+
     def _validate_index(self, index: int, for_insertion: bool = False) -> None:
         if not isinstance(index, int):
             raise TypeError("Index must be an integer.")
@@ -56,8 +236,21 @@ class CharDoublyLinkedList:
                 )
 
     def _get_node_at_index(self, index: int) -> "CharDoublyLinkedList._Node":
-        if index < self._size // 2:
+        finger_distance = index - self._finger_index
+        if self._finger_node is not None and abs(finger_distance) < min(
+            index, self._size - 1 - index
+        ):
+            current = self._finger_node
+            steps = abs(finger_distance)
+            if finger_distance > 0:
+                for _ in range(finger_distance):
+                    current = current.next
+            else:
+                for _ in range(-finger_distance):
+                    current = current.prev
+        elif index < self._size // 2:
             current = self.head
+            steps = index
             for _ in range(index):
                 if current:
                     current = current.next
@@ -65,7 +258,8 @@ class CharDoublyLinkedList:
                     raise RuntimeError("Internal error: Node traversal failed.")
         else:
             current = self.tail
-            for _ in range(self._size - 1 - index):
+            steps = self._size - 1 - index
+            for _ in range(steps):
                 if current:
                     current = current.prev
                 else:
@@ -74,14 +268,108 @@ class CharDoublyLinkedList:
             raise IndexError(
                 "Cannot get node from an empty or improperly indexed list."
             )
+        if self._traversal_observer is not None:
+            self._traversal_observer(steps)
+        self._finger_index = index
+        self._finger_node = current
         return current
 
+    def _physical_index(self, index: int) -> int:
+        return self._size - 1 - index if self._reversed else index
+
+    def _node_or_end(self, index: int) -> Optional["CharDoublyLinkedList._Node"]:
+        if index >= self._size:
+            return None
+        return self._get_node_at_index(self._physical_index(index))
+
+    def _next_logical(
+        self, node: "CharDoublyLinkedList._Node"
+    ) -> Optional["CharDoublyLinkedList._Node"]:
+        return node.prev if self._reversed else node.next
+
+    def _prev_logical(
+        self, node: "CharDoublyLinkedList._Node"
+    ) -> Optional["CharDoublyLinkedList._Node"]:
+        return node.next if self._reversed else node.prev
+
+    def _logical_head(self) -> Optional["CharDoublyLinkedList._Node"]:
+        return self.tail if self._reversed else self.head
+
+    def _logical_tail(self) -> Optional["CharDoublyLinkedList._Node"]:
+        return self.head if self._reversed else self.tail
+
+    def materialize(self) -> None:
+        if not self._reversed or self._ensure_owned():
+            return
+        self._reversed = False
+        self._version += 1
+        current = self.head
+        while current:
+            current.prev, current.next = current.next, current.prev
+            current = current.prev
+        self.head, self.tail = self.tail, self.head
+        self._finger_index = self._size - 1 - self._finger_index
+
+    @property
+    def is_reversed(self) -> bool:
+        return self._reversed
+
+    def _new_node(
+        self,
+        data: str,
+        prev_node: Optional["CharDoublyLinkedList._Node"] = None,
+        next_node: Optional["CharDoublyLinkedList._Node"] = None,
+    ) -> "CharDoublyLinkedList._Node":
+        if self._free_nodes:
+            node = self._free_nodes.pop()
+            node.data = data
+            node.prev = prev_node
+            node.next = next_node
+            return node
+        return self._Node(data, prev_node, next_node)
+
+    def _release_node(self, node: "CharDoublyLinkedList._Node") -> None:
+        node.prev = None
+        node.next = None
+        if len(self._free_nodes) < self._node_pool_size:
+            self._free_nodes.append(node)
+
+    def _track_share(self) -> None:
+        if not self._share_tracked:
+            self._share_tracked = True
+            weakref.finalize(self, _release_share, vars(self))
+
+    def _detach(self) -> None:
+        if self._share_count[0] > 1:
+            self._share_count[0] -= 1
+            self._share_count = [1]
+
+    def _ensure_owned(self) -> bool:
+        if self._share_count[0] == 1:
+            return False
+        text = self.to_string()
+        self._detach()
+        self.head = None
+        self.tail = None
+        self._size = 0
+        self._finger_node = None
+        self._reversed = False
+        self._extend_text(text)
+        return True
+
     def length(self) -> int:
         return self._size
 
     def append(self, element: str) -> None:
         self._validate_char(element)
-        new_node = self._Node(element)
+        self._ensure_owned()
+        if self._reversed and self.head is not None:
+            self._link_before(self.head, element, 0)
+        else:
+            self._append_node(element)
+
+    def _append_node(self, element: str) -> None:
+        new_node = self._new_node(element)
         if self.tail is None:
             self.head = new_node
             self.tail = new_node
@@ -90,6 +378,7 @@ class CharDoublyLinkedList:
             self.tail.next = new_node
             self.tail = new_node
         self._size += 1
+        self._version += 1
 
     def insert(self, element: str, index: int) -> None:
         self._validate_char(element)
@@ -97,29 +386,52 @@ class CharDoublyLinkedList:
         if index == self._size:
             self.append(element)
             return
-        new_node = self._Node(element)
-        if index == 0:
-            if self.head:
-                new_node.next = self.head
-                self.head.prev = new_node
-            self.head = new_node
-            if self.tail is None:
-                self.tail = new_node
+        self._ensure_owned()
+        if not self._reversed:
+            self._link_before(self._get_node_at_index(index), element, index)
+            return
+        physical_index = self._size - index
+        if physical_index == self._size:
+            self._append_node(element)
         else:
-            target_node = self._get_node_at_index(index)
-            prev_node_of_target = target_node.prev
-            new_node.next = target_node
-            new_node.prev = prev_node_of_target
-            if prev_node_of_target:
-                prev_node_of_target.next = new_node
-            target_node.prev = new_node
+            self._link_before(
+                self._get_node_at_index(physical_index), element, physical_index
+            )
+
+    def _link_before_logical(
+        self, target_node: "CharDoublyLinkedList._Node", element: str, index: int
+    ) -> None:
+        if not self._reversed:
+            self._link_before(target_node, element, index)
+        elif target_node.next is None:
+            self._append_node(element)
+        else:
+            self._link_before(target_node.next, element, self._size - index)
+
+    def _link_before(
+        self, target_node: "CharDoublyLinkedList._Node", element: str, index: int
+    ) -> None:
+        prev_node_of_target = target_node.prev
+        new_node = self._new_node(element, prev_node_of_target, target_node)
+        if prev_node_of_target:
+            prev_node_of_target.next = new_node
+        else:
+            self.head = new_node
+        target_node.prev = new_node
+        if self._finger_index >= index:
+            self._finger_index += 1
         self._size += 1
+        self._version += 1
 
     def delete(self, index: int) -> str:
         if self.length() == 0:
             raise IndexError("Cannot delete from an empty list.")
         self._validate_index(index)
-        node_to_delete = self._get_node_at_index(index)
+        self._ensure_owned()
+        physical_index = self._physical_index(index)
+        return self._unlink(self._get_node_at_index(physical_index), physical_index)
+
+    def _unlink(self, node_to_delete: "CharDoublyLinkedList._Node", index: int) -> str:
         deleted_data = node_to_delete.data
         prev_node = node_to_delete.prev
         next_node = node_to_delete.next
@@ -131,9 +443,13 @@ class CharDoublyLinkedList:
             next_node.prev = prev_node
         else:
             self.tail = prev_node
-        node_to_delete.prev = None
-        node_to_delete.next = None
+        if self._finger_node is node_to_delete:
+            self._finger_node = next_node
+        elif self._finger_index > index:
+            self._finger_index -= 1
+        self._release_node(node_to_delete)
         self._size -= 1
+        self._version += 1
         if self._size == 0:
             self.head = None
             self.tail = None
@@ -141,53 +457,59 @@ class CharDoublyLinkedList:
 
     def deleteAll(self, element: str) -> None:
         self._validate_char(element)
+        if self._share_count[0] > 1 and self.findFirst(element) == -1:
+            return
+        self._ensure_owned()
+        self._version += 1
+        self._finger_node = None
+        removed_count = 0
         current = self.head
         while current:
-            next_node_to_check = current.next
-            if current.data == element:
-                prev_node = current.prev
-                if prev_node:
-                    prev_node.next = next_node_to_check
-                else:
-                    self.head = next_node_to_check
-                if next_node_to_check:
-                    next_node_to_check.prev = prev_node
-                else:
-                    self.tail = prev_node
-                current.prev = None
-                current.next = None
-                self._size -= 1
-            current = next_node_to_check
-        if self._size == 0:
-            self.head = None
-            self.tail = None
+            if current.data != element:
+                current = current.next
+                continue
+            run_prev = current.prev
+            while current is not None and current.data == element:
+                next_node = current.next
+                self._release_node(current)
+                removed_count += 1
+                current = next_node
+            if run_prev:
+                run_prev.next = current
+            else:
+                self.head = current
+            if current:
+                current.prev = run_prev
+            else:
+                self.tail = run_prev
+        self._size -= removed_count
 
     def get(self, index: int) -> str:
         if self.length() == 0:
             raise IndexError("Cannot get from an empty list.")
         self._validate_index(index)
-        node = self._get_node_at_index(index)
+        node = self._get_node_at_index(self._physical_index(index))
         return node.data
 
     def clone(self) -> "CharDoublyLinkedList":
-        new_list = CharDoublyLinkedList()
-        current = self.head
-        while current:
-            new_list.append(current.data)
-            current = current.next
+        new_list = CharDoublyLinkedList(node_pool_size=self._node_pool_size)
+        new_list.head = self.head
+        new_list.tail = self.tail
+        new_list._size = self._size
+        new_list._share_count = self._share_count
+        new_list._reversed = self._reversed
+        self._share_count[0] += 1
+        self._track_share()
+        new_list._track_share()
         return new_list
 
     def reverse(self) -> None:
         if self._size < 2:
             return
-        current = self.head
-        while current:
-            current.prev, current.next = current.next, current.prev
-            current = current.prev
-        self.head, self.tail = self.tail, self.head
+        self._reversed = not self._reversed
+        self._version += 1
 
-    def findFirst(self, element: str) -> int:
-        self._validate_char(element)
+    def _find_from_head(self, element: str) -> int:
         current = self.head
         index = 0
         while current:
@@ -197,8 +519,7 @@ class CharDoublyLinkedList:
             index += 1
         return -1
 
-    def findLast(self, element: str) -> int:
-        self._validate_char(element)
+    def _find_from_tail(self, element: str) -> int:
         current = self.tail
         index = self._size - 1
         while current:
@@ -208,36 +529,200 @@ class CharDoublyLinkedList:
             index -= 1
         return -1
 
-    def clear(self) -> None:
+    def findFirst(self, element: str) -> int:
+        self._validate_char(element)
+        if self._reversed:
+            index = self._find_from_tail(element)
+            return index if index == -1 else self._physical_index(index)
+        return self._find_from_head(element)
+
+    def findLast(self, element: str) -> int:
+        self._validate_char(element)
+        if self._reversed:
+            index = self._find_from_head(element)
+            return index if index == -1 else self._physical_index(index)
+        return self._find_from_tail(element)
+
+    def count(self, element: str) -> int:
+        self._validate_char(element)
+        return self.to_string().count(element)
+
+    def find_all(self, element: str) -> PyList[int]:
+        self._validate_char(element)
+        return find_all(self.to_string(), element)
+
+    def find_substring(self, pattern: str) -> int:
+        validate_pattern(pattern)
+        return self.to_string().find(pattern)
+
+    def _release_chain(self) -> None:
+        free_nodes = self._free_nodes
         current = self.head
-        while current:
+        while current is not None and len(free_nodes) < self._node_pool_size:
             next_node = current.next
-            current.prev = None
-            current.next = None
+            self._release_node(current)
             current = next_node
+        while current is not None:
+            current.prev = None
+            current = current.next
+
+    def clear(self) -> None:
+        if self._share_count[0] == 1:
+            self._release_chain()
+        else:
+            self._detach()
         self.head = None
         self.tail = None
         self._size = 0
+        self._version += 1
+        self._finger_node = None
+        self._reversed = False
 
     def extend(self, elements_list: "CharDoublyLinkedList") -> None:
         if not isinstance(elements_list, CharDoublyLinkedList):
             raise TypeError("Argument must be an instance of CharDoublyLinkedList.")
-        current_other = elements_list.head
-        while current_other:
-            self.append(current_other.data)
-            current_other = current_other.next
+        text = elements_list.to_string()
+        self._ensure_owned()
+        self._extend_logical_text(text)
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        self._ensure_owned()
+        self._extend_logical_text(text)
+
+    def _extend_logical_text(self, text: str) -> None:
+        if self._reversed:
+            self._extend_text(text[::-1], at_head=True)
+        else:
+            self._extend_text(text)
+
+    def _extend_text(self, text: str, at_head: bool = False) -> None:
+        if not text:
+            return
+        node_class = self._Node
+        free_nodes = self._free_nodes
+        chain_head = chain_tail = self._new_node(text[0])
+        for char_element in islice(text, 1, None):
+            if free_nodes:
+                new_node = free_nodes.pop()
+                new_node.data = char_element
+                new_node.prev = chain_tail
+            else:
+                new_node = node_class(char_element, chain_tail)
+            chain_tail.next = new_node
+            chain_tail = new_node
+        if self.head is None:
+            self.head = chain_head
+            self.tail = chain_tail
+        elif at_head:
+            chain_tail.next = self.head
+            self.head.prev = chain_tail
+            self.head = chain_head
+            self._finger_index += len(text)
+        else:
+            chain_head.prev = self.tail
+            self.tail.next = chain_head
+            self.tail = chain_tail
+        self._size += len(text)
+        self._version += 1
+
+    def cursor(self, index: int = 0) -> "CharDoublyLinkedList.Cursor":
+        return self.Cursor(self, index)
+
+    def batch(self) -> "EditBatch":
+        return EditBatch(self)
+
+    def to_string(self) -> str:
+        text = "".join([current.data for current in self._iter_nodes()])
+        return text[::-1] if self._reversed else text
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+        validate_chunk_size(chunk_size)
+        elements = iter(self)
+        chunk = "".join(islice(elements, chunk_size))
+        while chunk:
+            yield chunk
+            chunk = "".join(islice(elements, chunk_size))
+
+    def write_to(self, fileobj: IO[str], chunk_size: int = CHUNK_SIZE) -> int:
+        return write_chunks(fileobj, self.iter_chunks(chunk_size))
+
+    async def aextend_from(
+        self,
+        reader: Any,
+        encoding: str = "utf-8",
+        chunk_size: int = ASYNC_CHUNK_SIZE,
+    ) -> int:
+        return await aread_chunks(reader, self.extend_from_str, encoding, chunk_size)
+
+    def aiter_chunks(self, chunk_size: int = ASYNC_CHUNK_SIZE) -> AsyncIterator[str]:
+        return ayield_chunks(self.iter_chunks(chunk_size))
+
+    def to_bytes(self, encoding: str = ENCODING_UTF8) -> bytes:
+        return encode(self.to_string(), encoding)
+
+    def __getstate__(self) -> Dict[str, bytes]:
+        return {"payload": self.to_bytes()}
+
+    def __setstate__(self, state: Dict[str, bytes]) -> None:
+        self.clear()
+        self._extend_text(decode(state["payload"]))
+
+    def __reduce__(self) -> Tuple[type, Tuple[None, int], Dict[str, bytes]]:
+        return type(self), (None, self._node_pool_size), self.__getstate__()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        version = self._version
+        current = self._logical_head()
+        while current:
+            yield current.data
+            if version != self._version:
+                raise RuntimeError("CharDoublyLinkedList changed during iteration.")
+            current = self._next_logical(current)
+
+    def __contains__(self, element: object) -> bool:
+        if not isinstance(element, str) or len(element) != 1:
+            return False
+        return self.findFirst(element) != -1
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[str, "CharDoublyLinkedList"]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step != 1:
+                return CharDoublyLinkedList.from_string(self.to_string()[index])
+            chars = []
+            if start < stop:
+                current = self._node_or_end(start)
+                for _ in range(stop - start):
+                    chars.append(current.data)
+                    current = self._next_logical(current)
+            return CharDoublyLinkedList.from_string("".join(chars))
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer or a slice.")
+        if index < 0:
+            index += self._size
+        if not (0 <= index < self._size):
+            raise IndexError(f"Index {index} out of bounds.")
+        return self._get_node_at_index(self._physical_index(index)).data
 
     def __str__(self) -> str:
         if not self.head:
             return "CharDoublyLinkedList([])"
-        elements = [repr(current.data) for current in self._iter_nodes()]
+        elements = [repr(char_element) for char_element in self]
         return f"CharDoublyLinkedList([{', '.join(elements)}])"
 
     def __repr__(self) -> str:
         if not self.head:
             return "CharDoublyLinkedList(head=None, tail=None, size=0)"
-        elements_str = "".join([current.data for current in self._iter_nodes()])
-        return f"CharDoublyLinkedList(elements='{elements_str}', size={self._size}, head='{self.head.data if self.head else None}', tail='{self.tail.data if self.tail else None}')"
+        elements_str = self.to_string()
+        head, tail = self._logical_head(), self._logical_tail()
+        return f"CharDoublyLinkedList(elements='{elements_str}', size={self._size}, head='{head.data if head else None}', tail='{tail.data if tail else None}')"
 
     def _iter_nodes(self):
         current = self.head
@@ -0,0 +1,205 @@
+from itertools import chain
+from typing import Iterator, List as PyList, Union
+
+from char_list_batch import EditBatch
+from char_search import find_all, validate_pattern
+
+
+class CharGapBufferList:
+
+    def __init__(self, initial_elements: Union[PyList[str], str, None] = None):
+        self._front: PyList[str] = []
+        self._back: PyList[str] = []
+        if initial_elements:
+            if isinstance(initial_elements, str):
+                self._front.extend(initial_elements)
+            elif isinstance(initial_elements, list):
+                self._front.extend(self._validate_chars(initial_elements))
+            else:
+                raise TypeError(
+                    "Initial elements must be a list of characters or a string."
+                )
+
+    @classmethod
+    def from_string(cls, text: str) -> "CharGapBufferList":
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        new_list = cls()
+        new_list._front.extend(text)
+        return new_list
+
+    def _validate_char(self, element: str) -> None:
+        if not isinstance(element, str) or len(element) != 1:
+            raise TypeError(
+                f"Element '{element}' must be a single character (str of length 1)."
+            )
+
+    def _validate_chars(self, elements: PyList[str]) -> str:
+        try:
+            text = "".join(elements)
+        except TypeError:
+            text = ""
+        if len(text) != len(elements) or len(set(map(len, elements))) > 1:
+            for element in elements:
+                self._validate_char(element)
+        return text
+
+    def _validate_index(self, index: int, for_insertion: bool = False) -> None:
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer.")
+        current_length = self.length()
+        if for_insertion:
+            if not (0 <= index <= current_length):
+                raise IndexError(
+                    f"Index {index} out of bounds for insertion. List length is {current_length}."
+                )
+        else:
+            if current_length == 0:
+                raise IndexError(f"Index {index} out of bounds. List is empty.")
+            if not (0 <= index < current_length):
+                raise IndexError(
+                    f"Index {index} out of bounds. Valid range is 0 to {current_length - 1}."
+                )
+
+    @property
+    def gap_position(self) -> int:
+        return len(self._front)
+
+    def _move_gap(self, index: int) -> None:
+        gap = len(self._front)
+        if index < gap:
+            moved = self._front[index:]
+            del self._front[index:]
+            moved.reverse()
+            self._back.extend(moved)
+        elif index > gap:
+            count = index - gap
+            moved = self._back[-count:]
+            del self._back[-count:]
+            moved.reverse()
+            self._front.extend(moved)
+
+    def _char_at(self, index: int) -> str:
+        gap = len(self._front)
+        if index < gap:
+            return self._front[index]
+        return self._back[len(self._back) - 1 - (index - gap)]
+
+    def length(self) -> int:
+        return len(self._front) + len(self._back)
+
+    def append(self, element: str) -> None:
+        self._validate_char(element)
+        self._move_gap(self.length())
+        self._front.append(element)
+
+    def insert(self, element: str, index: int) -> None:
+        self._validate_char(element)
+        self._validate_index(index, for_insertion=True)
+        self._move_gap(index)
+        self._front.append(element)
+
+    def delete(self, index: int) -> str:
+        if self.length() == 0:
+            raise IndexError("Cannot delete from an empty list.")
+        self._validate_index(index)
+        self._move_gap(index)
+        return self._back.pop()
+
+    def deleteAll(self, element: str) -> None:
+        self._validate_char(element)
+        if element in self._front or element in self._back:
+            remaining = self.to_string().replace(element, "")
+            self._front = list(remaining)
+            self._back = []
+
+    def get(self, index: int) -> str:
+        if self.length() == 0:
+            raise IndexError("Cannot get from an empty list.")
+        self._validate_index(index)
+        return self._char_at(index)
+
+    def clone(self) -> "CharGapBufferList":
+        new_list = CharGapBufferList()
+        new_list._front = self._front.copy()
+        new_list._back = self._back.copy()
+        return new_list
+
+    def reverse(self) -> None:
+        self._front, self._back = self._back, self._front
+
+    def findFirst(self, element: str) -> int:
+        self._validate_char(element)
+        if element in self._front:
+            return self._front.index(element)
+        position = "".join(self._back).rfind(element)
+        if position == -1:
+            return -1
+        return len(self._front) + len(self._back) - 1 - position
+
+    def findLast(self, element: str) -> int:
+        self._validate_char(element)
+        if element in self._back:
+            return self.length() - 1 - self._back.index(element)
+        return "".join(self._front).rfind(element)
+
+    def count(self, element: str) -> int:
+        self._validate_char(element)
+        return self._front.count(element) + self._back.count(element)
+
+    def find_all(self, element: str) -> PyList[int]:
+        self._validate_char(element)
+        return find_all(self.to_string(), element)
+
+    def find_substring(self, pattern: str) -> int:
+        validate_pattern(pattern)
+        return self.to_string().find(pattern)
+
+    def clear(self) -> None:
+        self._front = []
+        self._back = []
+
+    def extend(self, elements: "CharGapBufferList") -> None:
+        if not isinstance(elements, CharGapBufferList):
+            raise TypeError("Argument must be an instance of CharGapBufferList.")
+        text = elements.to_string()
+        self._move_gap(self.length())
+        self._front.extend(text)
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        self._move_gap(self.length())
+        self._front.extend(text)
+
+    def batch(self) -> "EditBatch":
+        return EditBatch(self)
+
+    def to_string(self) -> str:
+        return "".join(self._front) + "".join(reversed(self._back))
+
+    def __len__(self) -> int:
+        return self.length()
+
+    def __iter__(self) -> Iterator[str]:
+        return chain(self._front, reversed(self._back))
+
+    def __contains__(self, element: object) -> bool:
+        return element in self._front or element in self._back
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, "CharGapBufferList"]:
+        if isinstance(index, slice):
+            return CharGapBufferList.from_string(self.to_string()[index])
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer or a slice.")
+        if index < 0:
+            index += self.length()
+        if not (0 <= index < self.length()):
+            raise IndexError(f"Index {index} out of bounds.")
+        return self._char_at(index)
+
+    def __str__(self) -> str:
+        return f"CharGapBufferList([{', '.join(repr(char) for char in self)}])"
+
+    def __repr__(self) -> str:
+        return f"CharGapBufferList(elements={self.to_string()!r}, size={self.length()}, gap={self.gap_position})"
@@ -0,0 +1,157 @@
+import functools
+import inspect
+import json
+import threading
+import time
+import types
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from char_array_list import CharArrayList
+from char_doubly_linked_list import CharDoublyLinkedList
+
+DEFAULT_CLASSES = (CharArrayList, CharDoublyLinkedList)
+
+_SPECIAL_METHODS = ("__getitem__", "__contains__", "__len__")
+_STREAMING_METHODS = ("iter_chunks", "aiter_chunks", "aextend_from")
+
+
+class _Histogram:
+    __slots__ = ("count", "total", "buckets")
+
+    def __init__(self):
+        self.count: int = 0
+        self.total: int = 0
+        self.buckets: Dict[int, int] = {}
+
+    def record(self, value: int) -> None:
+        self.count += 1
+        self.total += value
+        bucket = 1 << (value - 1).bit_length() if value > 1 else value
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def clear(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.buckets = {}
+
+    def bucket_counts(self) -> Dict[str, int]:
+        return {str(bucket): count for bucket, count in sorted(self.buckets.items())}
+
+
+_originals: Dict[Tuple[type, str], Callable[..., Any]] = {}
+_method_stats: Dict[str, _Histogram] = {}
+_traversal_stats: Dict[str, _Histogram] = {}
+_inherited: Set[Tuple[type, str]] = set()
+_observed_classes: Set[type] = set()
+_local = threading.local()
+
+
+def _is_instrumented(name: str, attribute: Any) -> bool:
+    if not isinstance(attribute, types.FunctionType) or name in _STREAMING_METHODS:
+        return False
+    if (
+        inspect.isgeneratorfunction(attribute)
+        or inspect.iscoroutinefunction(attribute)
+        or inspect.isasyncgenfunction(attribute)
+    ):
+        return False
+    return not name.startswith("_") or name in _SPECIAL_METHODS
+
+
+def _timed(label: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    histogram = _method_stats.setdefault(label, _Histogram())
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if getattr(_local, "active", False):
+            return function(*args, **kwargs)
+        _local.active = True
+        started = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            histogram.record(time.perf_counter_ns() - started)
+            _local.active = False
+
+    return wrapper
+
+
+def enable(*classes: type) -> None:
+    for cls in classes or DEFAULT_CLASSES:
+        seen: Set[str] = set()
+        for owner in cls.__mro__[:-1]:
+            for name, attribute in list(vars(owner).items()):
+                if name in seen:
+                    continue
+                seen.add(name)
+                attribute = _originals.get((owner, name), attribute)
+                if (cls, name) in _originals or not _is_instrumented(name, attribute):
+                    continue
+                _originals[(cls, name)] = attribute
+                if owner is not cls:
+                    _inherited.add((cls, name))
+                setattr(cls, name, _timed(f"{cls.__name__}.{name}", attribute))
+        if "_traversal_observer" in vars(cls):
+            histogram = _traversal_stats.setdefault(cls.__name__, _Histogram())
+            cls._traversal_observer = histogram.record
+            _observed_classes.add(cls)
+
+
+def disable() -> None:
+    for (cls, name), attribute in _originals.items():
+        if (cls, name) in _inherited:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, attribute)
+    for cls in _observed_classes:
+        cls._traversal_observer = None
+    _originals.clear()
+    _inherited.clear()
+    _observed_classes.clear()
+
+
+def is_enabled() -> bool:
+    return bool(_originals or _observed_classes)
+
+
+def reset() -> None:
+    for histogram in list(_method_stats.values()) + list(_traversal_stats.values()):
+        histogram.clear()
+
+
+@contextmanager
+def instrumented(*classes: type) -> Iterator[None]:
+    enable(*classes)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot() -> Dict[str, Any]:
+    methods = {
+        label: {
+            "calls": histogram.count,
+            "total_seconds": histogram.total / 1e9,
+            "mean_seconds": histogram.total / histogram.count / 1e9,
+            "latency_ns": histogram.bucket_counts(),
+        }
+        for label, histogram in sorted(_method_stats.items())
+        if histogram.count
+    }
+    traversals = {
+        label: {
+            "lookups": histogram.count,
+            "total_steps": histogram.total,
+            "mean_steps": histogram.total / histogram.count,
+            "steps": histogram.bucket_counts(),
+        }
+        for label, histogram in sorted(_traversal_stats.items())
+        if histogram.count
+    }
+    return {"enabled": is_enabled(), "methods": methods, "traversals": traversals}
+
+
+def to_json(indent: Optional[int] = None) -> str:
+    return json.dumps(snapshot(), indent=indent)
@@ -0,0 +1,58 @@
+from typing import Any, List as PyList, Tuple
+
+from char_rope_list import CharRopeList
+
+
+class EditBatch:
+
+    def __init__(self, target: Any):
+        self._target = target
+        self._edits: PyList[Tuple[str, tuple]] = []
+
+    def append(self, element: str) -> None:
+        self._edits.append(("append", (element,)))
+
+    def insert(self, element: str, index: int) -> None:
+        self._edits.append(("insert", (element, index)))
+
+    def delete(self, index: int) -> None:
+        self._edits.append(("delete", (index,)))
+
+    def __len__(self) -> int:
+        return len(self._edits)
+
+    def commit(self) -> None:
+        if not self._edits:
+            return
+        if isinstance(self._target, CharRopeList):
+            scratch = self._target.clone()
+        else:
+            scratch = CharRopeList.from_string(self._target.to_string())
+        try:
+            for operation, arguments in self._edits:
+                getattr(scratch, operation)(*arguments)
+        finally:
+            self._edits = []
+        if isinstance(self._target, CharRopeList):
+            self._target._set_root(scratch._root)
+        else:
+            self._target.clear()
+            self._target.extend_from_str(scratch.to_string())
+
+    def discard(self) -> None:
+        self._edits = []
+
+    def __enter__(self) -> "EditBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+    def __repr__(self) -> str:
+        return (
+            f"EditBatch(target={type(self._target).__name__}, edits={len(self._edits)})"
+        )
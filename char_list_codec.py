@@ -0,0 +1,43 @@
+import struct
+from typing import Union
+
+MAGIC = b"CHLS"
+FORMAT_VERSION = 1
+
+ENCODING_UTF8 = "utf-8"
+ENCODING_UTF32 = "utf-32"
+
+_CODECS = {ENCODING_UTF8: (0, "utf-8"), ENCODING_UTF32: (1, "utf-32-le")}
+_FLAGS = {flag: codec for flag, codec in _CODECS.values()}
+_HEADER = struct.Struct("<4sBBQ")
+
+
+def encode(text: str, encoding: str = ENCODING_UTF8) -> bytes:
+    if encoding not in _CODECS:
+        raise ValueError(
+            f"Unknown encoding '{encoding}'. Expected '{ENCODING_UTF8}' or '{ENCODING_UTF32}'."
+        )
+    flag, codec = _CODECS[encoding]
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, flag, len(text))
+    return header + text.encode(codec, "surrogatepass")
+
+
+def decode(data: Union[bytes, bytearray, memoryview]) -> str:
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise TypeError("Data must be a bytes-like object.")
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise ValueError("Data is too short to contain a CharList header.")
+    magic, version, flag, length = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Data is not a serialized CharList.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported CharList format version {version}.")
+    if flag not in _FLAGS:
+        raise ValueError(f"Unknown CharList encoding flag {flag}.")
+    text = str(view[_HEADER.size :], _FLAGS[flag], "surrogatepass")
+    if len(text) != length:
+        raise ValueError(
+            f"Corrupted CharList payload: expected {length} characters, got {len(text)}."
+        )
+    return text
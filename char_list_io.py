@@ -0,0 +1,76 @@
+import asyncio
+import codecs
+import mmap
+from typing import IO, Any, AsyncIterator, Callable, Iterable, Iterator
+
+CHUNK_SIZE = 1 << 16
+ASYNC_CHUNK_SIZE = 1 << 12
+
+_LATIN1_CODEC = "iso8859-1"
+
+
+def validate_chunk_size(chunk_size: int) -> None:
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("Chunk size must be a positive integer.")
+
+
+def is_latin1(encoding: str) -> bool:
+    return codecs.lookup(encoding).name == _LATIN1_CODEC
+
+
+def read_chunks(
+    path: str, encoding: str = "utf-8", chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    validate_chunk_size(chunk_size)
+    with open(path, "r", encoding=encoding, newline="") as text_file:
+        chunk = text_file.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = text_file.read(chunk_size)
+
+
+def read_mapped_bytes(path: str) -> bytearray:
+    with open(path, "rb") as binary_file:
+        try:
+            mapped = mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return bytearray()
+        with mapped:
+            return bytearray(mapped)
+
+
+def write_chunks(fileobj: IO[str], chunks: Iterable[str]) -> int:
+    written = 0
+    for chunk in chunks:
+        fileobj.write(chunk)
+        written += len(chunk)
+    return written
+
+
+async def aread_chunks(
+    reader: Any,
+    consume: Callable[[str], None],
+    encoding: str = "utf-8",
+    chunk_size: int = ASYNC_CHUNK_SIZE,
+) -> int:
+    validate_chunk_size(chunk_size)
+    decoder = codecs.getincrementaldecoder(encoding)()
+    consumed = 0
+    while True:
+        data = await reader.read(chunk_size)
+        if isinstance(data, str):
+            text = data
+        else:
+            text = decoder.decode(data, final=not data)
+        if text:
+            consume(text)
+            consumed += len(text)
+        if not data:
+            return consumed
+        await asyncio.sleep(0)
+
+
+async def ayield_chunks(chunks: Iterable[str]) -> AsyncIterator[str]:
+    for chunk in chunks:
+        yield chunk
+        await asyncio.sleep(0)
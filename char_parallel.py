@@ -0,0 +1,234 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any, List as PyList, Optional, Tuple
+
+from char_array_list import CharArrayList, STORAGE_COMPACT, _WIDE_ENCODING
+
+PARALLEL_THRESHOLD = 1 << 22
+SHARDS_PER_WORKER = 4
+SERIAL_WINDOW = 1 << 16
+
+_LATIN1_ENCODING = "latin-1"
+
+
+def _shard_text(name: str, encoding: str, item_size: int, start: int, stop: int) -> str:
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        with segment.buf[start * item_size : stop * item_size] as view:
+            return bytes(view).decode(encoding, "surrogatepass")
+    finally:
+        segment.close()
+
+
+def _find_in_shard(
+    name: str,
+    encoding: str,
+    item_size: int,
+    start: int,
+    stop: int,
+    element: str,
+    last: bool,
+) -> int:
+    text = _shard_text(name, encoding, item_size, start, stop)
+    position = text.rfind(element) if last else text.find(element)
+    return position if position == -1 else start + position
+
+
+def _compact_shard(
+    name: str,
+    output_name: str,
+    encoding: str,
+    item_size: int,
+    start: int,
+    stop: int,
+    element: str,
+) -> int:
+    remaining = _shard_text(name, encoding, item_size, start, stop).replace(element, "")
+    encoded = remaining.encode(encoding, "surrogatepass")
+    output = shared_memory.SharedMemory(name=output_name)
+    try:
+        offset = start * item_size
+        output.buf[offset : offset + len(encoded)] = encoded
+    finally:
+        output.close()
+    return len(remaining)
+
+
+class ParallelSearch:
+
+    def __init__(
+        self, max_workers: Optional[int] = None, threshold: int = PARALLEL_THRESHOLD
+    ):
+        if max_workers is not None and (
+            not isinstance(max_workers, int) or max_workers < 1
+        ):
+            raise ValueError("Number of workers must be a positive integer.")
+        if not isinstance(threshold, int) or threshold < 0:
+            raise ValueError("Threshold must be a non-negative integer.")
+        self._max_workers: int = max_workers or os.cpu_count() or 1
+        self._threshold: int = threshold
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self._max_workers)
+        return self._executor
+
+    def _shards(self, size: int) -> PyList[Tuple[int, int]]:
+        shard_count = self._max_workers * SHARDS_PER_WORKER
+        shard_size = max(1, -(-size // shard_count))
+        return [
+            (start, min(start + shard_size, size))
+            for start in range(0, size, shard_size)
+        ]
+
+    def _is_parallel(self, lst: Any, search: bool = False) -> bool:
+        if not isinstance(lst, CharArrayList) or lst.length() < self._threshold:
+            return False
+        if lst.storage != STORAGE_COMPACT:
+            return not search
+        return lst.buffer_encoding != _LATIN1_ENCODING
+
+    def _segment(self, data: Any) -> shared_memory.SharedMemory:
+        segment = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+        segment.buf[: len(data)] = data
+        return segment
+
+    def _share(self, lst: Any) -> Tuple[shared_memory.SharedMemory, str, int]:
+        if lst.storage == STORAGE_COMPACT:
+            encoding = lst.buffer_encoding
+            with memoryview(lst._data._buf).toreadonly().cast("B") as data:
+                segment = self._segment(data)
+        else:
+            text = lst._physical_text()
+            try:
+                data = text.encode(_LATIN1_ENCODING)
+                encoding = _LATIN1_ENCODING
+            except UnicodeEncodeError:
+                data = text.encode(_WIDE_ENCODING, "surrogatepass")
+                encoding = _WIDE_ENCODING
+            segment = self._segment(data)
+        item_size = 1 if encoding == _LATIN1_ENCODING else 4
+        return segment, encoding, item_size
+
+    def _window_find(self, lst: Any, element: str, last: bool, size: int) -> int:
+        window = min(SERIAL_WINDOW, size)
+        start = size - window if last else 0
+        with memoryview(lst._data._buf).toreadonly().cast("B") as data:
+            text = bytes(data[start * 4 : (start + window) * 4]).decode(
+                lst.buffer_encoding, "surrogatepass"
+            )
+        position = text.rfind(element) if last else text.find(element)
+        return position if position == -1 else start + position
+
+    def _parallel_find(self, lst: Any, element: str, last: bool, size: int) -> int:
+        segment, encoding, item_size = self._share(lst)
+        try:
+            shards = self._shards(size)
+            if last:
+                shards.reverse()
+            futures = [
+                self._pool().submit(
+                    _find_in_shard,
+                    segment.name,
+                    encoding,
+                    item_size,
+                    start,
+                    stop,
+                    element,
+                    last,
+                )
+                for start, stop in shards
+            ]
+            result = -1
+            for future in futures:
+                if result == -1:
+                    result = future.result()
+                else:
+                    future.cancel()
+            wait(futures)
+            return result
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def _find(self, lst: Any, element: str, last: bool) -> int:
+        lst._validate_char(element)
+        if not self._is_parallel(lst, search=True):
+            return lst.findLast(element) if last else lst.findFirst(element)
+        size = lst.length()
+        reversed_order = lst.is_reversed
+        if reversed_order:
+            last = not last
+        result = self._window_find(lst, element, last, size)
+        if result == -1 and size > SERIAL_WINDOW:
+            result = self._parallel_find(lst, element, last, size)
+        if reversed_order and result != -1:
+            return size - 1 - result
+        return result
+
+    def find_first(self, lst: Any, element: str) -> int:
+        return self._find(lst, element, last=False)
+
+    def find_last(self, lst: Any, element: str) -> int:
+        return self._find(lst, element, last=True)
+
+    def delete_all(self, lst: Any, element: str) -> None:
+        lst._validate_char(element)
+        if not self._is_parallel(lst):
+            lst.deleteAll(element)
+            return
+        size = lst.length()
+        segment, encoding, item_size = self._share(lst)
+        output = shared_memory.SharedMemory(create=True, size=segment.size)
+        try:
+            shards = self._shards(size)
+            futures = [
+                self._pool().submit(
+                    _compact_shard,
+                    segment.name,
+                    output.name,
+                    encoding,
+                    item_size,
+                    start,
+                    stop,
+                    element,
+                )
+                for start, stop in shards
+            ]
+            pieces = []
+            for (start, _), future in zip(shards, futures):
+                offset = start * item_size
+                with output.buf[offset : offset + future.result() * item_size] as view:
+                    pieces.append(bytes(view).decode(encoding, "surrogatepass"))
+            remaining = "".join(pieces)
+        finally:
+            for shared in (segment, output):
+                shared.close()
+                shared.unlink()
+        if len(remaining) != size:
+            reversed_order = lst.is_reversed
+            lst.clear()
+            lst.extend_from_str(remaining)
+            if reversed_order:
+                lst.reverse()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ParallelSearch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.close()
+        return False
+
+    def __repr__(self) -> str:
+        return f"ParallelSearch(max_workers={self._max_workers}, threshold={self._threshold})"
@@ -0,0 +1,336 @@
+from typing import TYPE_CHECKING, Iterator, List as PyList, Optional, Tuple, Union
+
+from char_search import find_all_in_chunks, validate_pattern
+
+if TYPE_CHECKING:
+    from char_list_batch import EditBatch
+
+LEAF_SIZE = 256
+
+
+class _RopeNode:
+    __slots__ = ("text", "left", "right", "length", "height")
+
+    def __init__(
+        self,
+        text: str = "",
+        left: Optional["_RopeNode"] = None,
+        right: Optional["_RopeNode"] = None,
+    ):
+        self.text: str = text
+        self.left: Optional[_RopeNode] = left
+        self.right: Optional[_RopeNode] = right
+        if left is None or right is None:
+            self.length: int = len(text)
+            self.height: int = 0
+        else:
+            self.length = left.length + right.length
+            self.height = 1 + max(left.height, right.height)
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.left is None
+
+    def __repr__(self) -> str:
+        if self.is_leaf:
+            return f"Leaf({self.text!r})"
+        return f"Concat(length={self.length}, height={self.height})"
+
+
+def _balance(left: _RopeNode, right: _RopeNode) -> _RopeNode:
+    balance_factor = left.height - right.height
+    if balance_factor > 1:
+        if left.left.height >= left.right.height:
+            return _RopeNode("", left.left, _RopeNode("", left.right, right))
+        inner = left.right
+        return _RopeNode(
+            "",
+            _RopeNode("", left.left, inner.left),
+            _RopeNode("", inner.right, right),
+        )
+    if balance_factor < -1:
+        if right.right.height >= right.left.height:
+            return _RopeNode("", _RopeNode("", left, right.left), right.right)
+        inner = right.left
+        return _RopeNode(
+            "",
+            _RopeNode("", left, inner.left),
+            _RopeNode("", inner.right, right.right),
+        )
+    return _RopeNode("", left, right)
+
+
+def _concat(
+    left: Optional[_RopeNode], right: Optional[_RopeNode]
+) -> Optional[_RopeNode]:
+    if left is None or left.length == 0:
+        return right
+    if right is None or right.length == 0:
+        return left
+    if left.is_leaf and right.is_leaf:
+        if left.length + right.length <= LEAF_SIZE:
+            return _RopeNode(left.text + right.text)
+        return _RopeNode("", left, right)
+    if right.is_leaf and left.right.is_leaf:
+        if left.right.length + right.length <= LEAF_SIZE:
+            return _RopeNode("", left.left, _RopeNode(left.right.text + right.text))
+    if left.is_leaf and right.left.is_leaf:
+        if left.length + right.left.length <= LEAF_SIZE:
+            return _RopeNode("", _RopeNode(left.text + right.left.text), right.right)
+    if left.height > right.height + 1:
+        return _balance(left.left, _concat(left.right, right))
+    if right.height > left.height + 1:
+        return _balance(_concat(left, right.left), right.right)
+    return _RopeNode("", left, right)
+
+
+def _split(
+    node: Optional[_RopeNode], index: int
+) -> Tuple[Optional[_RopeNode], Optional[_RopeNode]]:
+    if node is None:
+        return None, None
+    if index <= 0:
+        return None, node
+    if index >= node.length:
+        return node, None
+    if node.is_leaf:
+        return _RopeNode(node.text[:index]), _RopeNode(node.text[index:])
+    if index <= node.left.length:
+        left_part, right_part = _split(node.left, index)
+        return left_part, _concat(right_part, node.right)
+    left_part, right_part = _split(node.right, index - node.left.length)
+    return _concat(node.left, left_part), right_part
+
+
+def _build(text: str) -> Optional[_RopeNode]:
+    if not text:
+        return None
+    leaves = [
+        _RopeNode(text[start : start + LEAF_SIZE])
+        for start in range(0, len(text), LEAF_SIZE)
+    ]
+    return _build_balanced(leaves, 0, len(leaves))
+
+
+def _build_balanced(leaves: PyList[_RopeNode], start: int, stop: int) -> _RopeNode:
+    if stop - start == 1:
+        return leaves[start]
+    middle = (start + stop) // 2
+    return _RopeNode(
+        "",
+        _build_balanced(leaves, start, middle),
+        _build_balanced(leaves, middle, stop),
+    )
+
+
+def _iter_leaves(node: Optional[_RopeNode], reverse: bool = False) -> Iterator[str]:
+    stack = [node] if node is not None else []
+    while stack:
+        current = stack.pop()
+        if current.is_leaf:
+            yield current.text
+        elif reverse:
+            stack.append(current.left)
+            stack.append(current.right)
+        else:
+            stack.append(current.right)
+            stack.append(current.left)
+
+
+def _char_at(node: _RopeNode, index: int) -> str:
+    while not node.is_leaf:
+        if index < node.left.length:
+            node = node.left
+        else:
+            index -= node.left.length
+            node = node.right
+    return node.text[index]
+
+
+class CharRopeList:
+
+    def __init__(self, initial_elements: Union[PyList[str], str, None] = None):
+        self._root: Optional[_RopeNode] = None
+        if initial_elements:
+            if isinstance(initial_elements, str):
+                self._root = _build(initial_elements)
+            elif isinstance(initial_elements, list):
+                self._root = _build(self._validate_chars(initial_elements))
+            else:
+                raise TypeError(
+                    "Initial elements must be a list of characters or a string."
+                )
+
+    @classmethod
+    def from_string(cls, text: str) -> "CharRopeList":
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        return cls(text)
+
+    def _validate_char(self, element: str) -> None:
+        if not isinstance(element, str) or len(element) != 1:
+            raise TypeError(
+                f"Element '{element}' must be a single character (str of length 1)."
+            )
+
+    def _validate_chars(self, elements: PyList[str]) -> str:
+        try:
+            text = "".join(elements)
+        except TypeError:
+            text = ""
+        if len(text) != len(elements) or len(set(map(len, elements))) > 1:
+            for element in elements:
+                self._validate_char(element)
+        return text
+
+    def _validate_index(self, index: int, for_insertion: bool = False) -> None:
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer.")
+        current_length = self.length()
+        if for_insertion:
+            if not (0 <= index <= current_length):
+                raise IndexError(
+                    f"Index {index} out of bounds for insertion. List length is {current_length}."
+                )
+        else:
+            if current_length == 0:
+                raise IndexError(f"Index {index} out of bounds. List is empty.")
+            if not (0 <= index < current_length):
+                raise IndexError(
+                    f"Index {index} out of bounds. Valid range is 0 to {current_length - 1}."
+                )
+
+    def _set_root(self, new_root: Optional[_RopeNode]) -> None:
+        self._root = new_root
+
+    def length(self) -> int:
+        return self._root.length if self._root is not None else 0
+
+    def append(self, element: str) -> None:
+        self._validate_char(element)
+        self._set_root(_concat(self._root, _RopeNode(element)))
+
+    def insert(self, element: str, index: int) -> None:
+        self._validate_char(element)
+        self._validate_index(index, for_insertion=True)
+        left_part, right_part = _split(self._root, index)
+        self._set_root(_concat(_concat(left_part, _RopeNode(element)), right_part))
+
+    def delete(self, index: int) -> str:
+        if self.length() == 0:
+            raise IndexError("Cannot delete from an empty list.")
+        self._validate_index(index)
+        left_part, rest = _split(self._root, index)
+        deleted_part, right_part = _split(rest, 1)
+        self._set_root(_concat(left_part, right_part))
+        return deleted_part.text
+
+    def deleteAll(self, element: str) -> None:
+        self._validate_char(element)
+        if element in self:
+            self._set_root(_build(self.to_string().replace(element, "")))
+
+    def get(self, index: int) -> str:
+        if self.length() == 0:
+            raise IndexError("Cannot get from an empty list.")
+        self._validate_index(index)
+        return _char_at(self._root, index)
+
+    def clone(self) -> "CharRopeList":
+        new_list = CharRopeList()
+        new_list._root = self._root
+        return new_list
+
+    def reverse(self) -> None:
+        if self.length() > 1:
+            self._set_root(_build(self.to_string()[::-1]))
+
+    def findFirst(self, element: str) -> int:
+        self._validate_char(element)
+        offset = 0
+        for text in _iter_leaves(self._root):
+            position = text.find(element)
+            if position != -1:
+                return offset + position
+            offset += len(text)
+        return -1
+
+    def findLast(self, element: str) -> int:
+        self._validate_char(element)
+        offset = self.length()
+        for text in _iter_leaves(self._root, reverse=True):
+            offset -= len(text)
+            position = text.rfind(element)
+            if position != -1:
+                return offset + position
+        return -1
+
+    def count(self, element: str) -> int:
+        self._validate_char(element)
+        return sum(text.count(element) for text in _iter_leaves(self._root))
+
+    def find_all(self, element: str) -> PyList[int]:
+        self._validate_char(element)
+        return find_all_in_chunks(_iter_leaves(self._root), element)
+
+    def find_substring(self, pattern: str) -> int:
+        validate_pattern(pattern)
+        return self.to_string().find(pattern)
+
+    def clear(self) -> None:
+        self._set_root(None)
+
+    def extend(self, elements: "CharRopeList") -> None:
+        if not isinstance(elements, CharRopeList):
+            raise TypeError("Argument must be an instance of CharRopeList.")
+        self._set_root(_concat(self._root, elements._root))
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        self._set_root(_concat(self._root, _build(text)))
+
+    def batch(self) -> "EditBatch":
+        from char_list_batch import EditBatch
+
+        return EditBatch(self)
+
+    def to_string(self) -> str:
+        return "".join(_iter_leaves(self._root))
+
+    def __len__(self) -> int:
+        return self.length()
+
+    def __iter__(self) -> Iterator[str]:
+        for text in _iter_leaves(self._root):
+            yield from text
+
+    def __contains__(self, element: object) -> bool:
+        if not isinstance(element, str) or len(element) != 1:
+            return False
+        return self.findFirst(element) != -1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, "CharRopeList"]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length())
+            if step != 1:
+                return CharRopeList.from_string(self.to_string()[index])
+            new_list = CharRopeList()
+            if start < stop:
+                head_part = _split(self._root, stop)[0]
+                new_list._root = _split(head_part, start)[1]
+            return new_list
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer or a slice.")
+        if index < 0:
+            index += self.length()
+        if not (0 <= index < self.length()):
+            raise IndexError(f"Index {index} out of bounds.")
+        return _char_at(self._root, index)
+
+    def __str__(self) -> str:
+        return f"CharRopeList([{', '.join(repr(char) for char in self)}])"
+
+    def __repr__(self) -> str:
+        height = self._root.height if self._root is not None else 0
+        return f"CharRopeList(elements={self.to_string()!r}, size={self.length()}, height={height})"
@@ -0,0 +1,26 @@
+from typing import Iterable, List as PyList
+
+
+def validate_pattern(pattern: str) -> None:
+    if not isinstance(pattern, str):
+        raise TypeError("Pattern must be a string.")
+    if not pattern:
+        raise ValueError("Pattern must not be empty.")
+
+
+def find_all(text: str, element: str, offset: int = 0) -> PyList[int]:
+    positions = []
+    position = text.find(element)
+    while position != -1:
+        positions.append(offset + position)
+        position = text.find(element, position + 1)
+    return positions
+
+
+def find_all_in_chunks(chunks: Iterable[str], element: str) -> PyList[int]:
+    positions = []
+    offset = 0
+    for chunk in chunks:
+        positions.extend(find_all(chunk, element, offset))
+        offset += len(chunk)
+    return positions
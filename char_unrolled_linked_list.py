@@ -0,0 +1,314 @@
+from typing import Iterator, List as PyList, Optional, Tuple, Union
+
+from char_list_batch import EditBatch
+from char_search import find_all_in_chunks, validate_pattern
+
+BLOCK_SIZE = 64
+
+
+class CharUnrolledLinkedList:
+    class _Block:
+        def __init__(
+            self,
+            data: str,
+            prev_block: Optional["CharUnrolledLinkedList._Block"] = None,
+            next_block: Optional["CharUnrolledLinkedList._Block"] = None,
+        ):
+            self.data: str = data
+            self.prev: Optional[CharUnrolledLinkedList._Block] = prev_block
+            self.next: Optional[CharUnrolledLinkedList._Block] = next_block
+
+        def __repr__(self) -> str:
+            return f"Block({self.data!r})"
+
+    def __init__(
+        self,
+        initial_elements: Union[PyList[str], str, None] = None,
+        block_size: int = BLOCK_SIZE,
+    ):
+        if not isinstance(block_size, int) or block_size < 2:
+            raise ValueError("Block size must be an integer of at least 2.")
+        self.head: Optional[CharUnrolledLinkedList._Block] = None
+        self.tail: Optional[CharUnrolledLinkedList._Block] = None
+        self._size: int = 0
+        self._block_size: int = block_size
+        if initial_elements:
+            if isinstance(initial_elements, str):
+                self._extend_text(initial_elements)
+            elif isinstance(initial_elements, list):
+                self._extend_text(self._validate_chars(initial_elements))
+            else:
+                raise TypeError(
+                    "Initial elements must be a list of characters or a string."
+                )
+
+    @classmethod
+    def from_string(
+        cls, text: str, block_size: int = BLOCK_SIZE
+    ) -> "CharUnrolledLinkedList":
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        new_list = cls(block_size=block_size)
+        new_list._extend_text(text)
+        return new_list
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    def _validate_char(self, element: str) -> None:
+        if not isinstance(element, str) or len(element) != 1:
+            raise TypeError(
+                f"Element '{element}' must be a single character (str of length 1)."
+            )
+
+    def _validate_chars(self, elements: PyList[str]) -> str:
+        try:
+            text = "".join(elements)
+        except TypeError:
+            text = ""
+        if len(text) != len(elements) or len(set(map(len, elements))) > 1:
+            for element in elements:
+                self._validate_char(element)
+        return text
+
+    def _validate_index(self, index: int, for_insertion: bool = False) -> None:
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer.")
+        current_length = self.length()
+        if for_insertion:
+            if not (0 <= index <= current_length):
+                raise IndexError(
+                    f"Index {index} out of bounds for insertion. List length is {current_length}."
+                )
+        else:
+            if current_length == 0:
+                raise IndexError(f"Index {index} out of bounds. List is empty.")
+            if not (0 <= index < current_length):
+                raise IndexError(
+                    f"Index {index} out of bounds. Valid range is 0 to {current_length - 1}."
+                )
+
+    def _locate(self, index: int) -> Tuple["CharUnrolledLinkedList._Block", int]:
+        if index < self._size // 2:
+            current = self.head
+            while current is not None and index >= len(current.data):
+                index -= len(current.data)
+                current = current.next
+        else:
+            current = self.tail
+            offset = self._size
+            while current is not None and index < offset - len(current.data):
+                offset -= len(current.data)
+                current = current.prev
+            if current is not None:
+                index -= offset - len(current.data)
+        if current is None:
+            raise RuntimeError("Internal error: Block traversal failed.")
+        return current, index
+
+    def _link_after(
+        self, block: Optional["CharUnrolledLinkedList._Block"], data: str
+    ) -> "CharUnrolledLinkedList._Block":
+        next_block = block.next if block is not None else self.head
+        new_block = self._Block(data, block, next_block)
+        if block is not None:
+            block.next = new_block
+        else:
+            self.head = new_block
+        if next_block is not None:
+            next_block.prev = new_block
+        else:
+            self.tail = new_block
+        return new_block
+
+    def _unlink(self, block: "CharUnrolledLinkedList._Block") -> None:
+        if block.prev is not None:
+            block.prev.next = block.next
+        else:
+            self.head = block.next
+        if block.next is not None:
+            block.next.prev = block.prev
+        else:
+            self.tail = block.prev
+        block.prev = None
+        block.next = None
+
+    def _extend_text(self, text: str) -> None:
+        if not text:
+            return
+        self._size += len(text)
+        start = 0
+        if self.tail is not None and len(self.tail.data) < self._block_size:
+            start = self._block_size - len(self.tail.data)
+            self.tail.data += text[:start]
+        for chunk_start in range(start, len(text), self._block_size):
+            self._link_after(
+                self.tail, text[chunk_start : chunk_start + self._block_size]
+            )
+
+    def length(self) -> int:
+        return self._size
+
+    def append(self, element: str) -> None:
+        self._validate_char(element)
+        self._extend_text(element)
+
+    def insert(self, element: str, index: int) -> None:
+        self._validate_char(element)
+        self._validate_index(index, for_insertion=True)
+        if index == self._size:
+            self._extend_text(element)
+            return
+        block, offset = self._locate(index)
+        data = block.data[:offset] + element + block.data[offset:]
+        if len(data) > self._block_size:
+            half = len(data) // 2
+            block.data = data[:half]
+            self._link_after(block, data[half:])
+        else:
+            block.data = data
+        self._size += 1
+
+    def delete(self, index: int) -> str:
+        if self.length() == 0:
+            raise IndexError("Cannot delete from an empty list.")
+        self._validate_index(index)
+        block, offset = self._locate(index)
+        deleted_data = block.data[offset]
+        block.data = block.data[:offset] + block.data[offset + 1 :]
+        self._size -= 1
+        if not block.data:
+            self._unlink(block)
+        elif len(block.data) < self._block_size // 4:
+            neighbour = block.next
+            if neighbour is not None and (
+                len(block.data) + len(neighbour.data) <= self._block_size
+            ):
+                block.data += neighbour.data
+                self._unlink(neighbour)
+        return deleted_data
+
+    def deleteAll(self, element: str) -> None:
+        self._validate_char(element)
+        if self.findFirst(element) == -1:
+            return
+        remaining = self.to_string().replace(element, "")
+        self.clear()
+        self._extend_text(remaining)
+
+    def get(self, index: int) -> str:
+        if self.length() == 0:
+            raise IndexError("Cannot get from an empty list.")
+        self._validate_index(index)
+        block, offset = self._locate(index)
+        return block.data[offset]
+
+    def clone(self) -> "CharUnrolledLinkedList":
+        return CharUnrolledLinkedList.from_string(self.to_string(), self._block_size)
+
+    def reverse(self) -> None:
+        current = self.head
+        while current:
+            current.data = current.data[::-1]
+            current.prev, current.next = current.next, current.prev
+            current = current.prev
+        self.head, self.tail = self.tail, self.head
+
+    def findFirst(self, element: str) -> int:
+        self._validate_char(element)
+        offset = 0
+        for block in self._iter_blocks():
+            position = block.data.find(element)
+            if position != -1:
+                return offset + position
+            offset += len(block.data)
+        return -1
+
+    def findLast(self, element: str) -> int:
+        self._validate_char(element)
+        offset = self._size
+        current = self.tail
+        while current:
+            offset -= len(current.data)
+            position = current.data.rfind(element)
+            if position != -1:
+                return offset + position
+            current = current.prev
+        return -1
+
+    def count(self, element: str) -> int:
+        self._validate_char(element)
+        return sum(block.data.count(element) for block in self._iter_blocks())
+
+    def find_all(self, element: str) -> PyList[int]:
+        self._validate_char(element)
+        return find_all_in_chunks(
+            (block.data for block in self._iter_blocks()), element
+        )
+
+    def find_substring(self, pattern: str) -> int:
+        validate_pattern(pattern)
+        return self.to_string().find(pattern)
+
+    def clear(self) -> None:
+        self.head = None
+        self.tail = None
+        self._size = 0
+
+    def extend(self, elements_list: "CharUnrolledLinkedList") -> None:
+        if not isinstance(elements_list, CharUnrolledLinkedList):
+            raise TypeError("Argument must be an instance of CharUnrolledLinkedList.")
+        self._extend_text(elements_list.to_string())
+
+    def extend_from_str(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string.")
+        self._extend_text(text)
+
+    def batch(self) -> "EditBatch":
+        return EditBatch(self)
+
+    def to_string(self) -> str:
+        return "".join([block.data for block in self._iter_blocks()])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        for block in self._iter_blocks():
+            yield from block.data
+
+    def __contains__(self, element: object) -> bool:
+        if not isinstance(element, str) or len(element) != 1:
+            return False
+        return self.findFirst(element) != -1
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[str, "CharUnrolledLinkedList"]:
+        if isinstance(index, slice):
+            return CharUnrolledLinkedList.from_string(
+                self.to_string()[index], self._block_size
+            )
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer or a slice.")
+        if index < 0:
+            index += self._size
+        if not (0 <= index < self._size):
+            raise IndexError(f"Index {index} out of bounds.")
+        block, offset = self._locate(index)
+        return block.data[offset]
+
+    def __str__(self) -> str:
+        return f"CharUnrolledLinkedList([{', '.join(repr(char) for char in self)}])"
+
+    def __repr__(self) -> str:
+        block_count = sum(1 for _ in self._iter_blocks())
+        return f"CharUnrolledLinkedList(elements={self.to_string()!r}, size={self._size}, blocks={block_count})"
+
+    def _iter_blocks(self):
+        current = self.head
+        while current:
+            yield current
+            current = current.next
@@ -0,0 +1,100 @@
+from typing import List as PyList, Optional, Union
+
+from char_rope_list import CharRopeList, _RopeNode
+
+
+class CharVersionedList(CharRopeList):
+
+    def __init__(
+        self,
+        initial_elements: Union[PyList[str], str, None] = None,
+        max_versions: Optional[int] = None,
+    ):
+        if max_versions is not None and (
+            not isinstance(max_versions, int) or max_versions < 1
+        ):
+            raise ValueError("Maximum number of versions must be a positive integer.")
+        super().__init__(initial_elements)
+        self._max_versions: Optional[int] = max_versions
+        self._versions: PyList[Optional[_RopeNode]] = [self._root]
+        self._current: int = 0
+        self._base_version: int = 0
+
+    def _set_root(self, new_root: Optional[_RopeNode]) -> None:
+        if new_root is self._root:
+            return
+        del self._versions[self._current + 1 :]
+        self._versions.append(new_root)
+        self._current += 1
+        if self._max_versions is not None and len(self._versions) > self._max_versions:
+            dropped = len(self._versions) - self._max_versions
+            del self._versions[:dropped]
+            self._current -= dropped
+            self._base_version += dropped
+        self._root = new_root
+
+    @property
+    def version(self) -> int:
+        return self._base_version + self._current
+
+    @property
+    def oldest_version(self) -> int:
+        return self._base_version
+
+    @property
+    def latest_version(self) -> int:
+        return self._base_version + len(self._versions) - 1
+
+    @property
+    def can_undo(self) -> bool:
+        return self._current > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._current < len(self._versions) - 1
+
+    def undo(self) -> None:
+        if not self.can_undo:
+            raise IndexError("Nothing to undo.")
+        self._current -= 1
+        self._root = self._versions[self._current]
+
+    def redo(self) -> None:
+        if not self.can_redo:
+            raise IndexError("Nothing to redo.")
+        self._current += 1
+        self._root = self._versions[self._current]
+
+    def _version_slot(self, version: int) -> int:
+        if not isinstance(version, int):
+            raise TypeError("Version must be an integer.")
+        if not (self.oldest_version <= version <= self.latest_version):
+            raise IndexError(
+                f"Version {version} is not available. "
+                f"Valid range is {self.oldest_version} to {self.latest_version}."
+            )
+        return version - self._base_version
+
+    def checkout(self, version: int) -> None:
+        self._current = self._version_slot(version)
+        self._root = self._versions[self._current]
+
+    def clone(self) -> "CharVersionedList":
+        new_list = CharVersionedList(max_versions=self._max_versions)
+        new_list._root = self._root
+        new_list._versions = [self._root]
+        return new_list
+
+    def snapshot(self, version: Optional[int] = None) -> CharRopeList:
+        new_list = CharRopeList()
+        if version is None:
+            new_list._root = self._root
+        else:
+            new_list._root = self._versions[self._version_slot(version)]
+        return new_list
+
+    def __repr__(self) -> str:
+        return (
+            f"CharVersionedList(elements={self.to_string()!r}, size={self.length()}, "
+            f"version={self.version}, versions={len(self._versions)})"
+        )
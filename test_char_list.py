@@ -1,7 +1,28 @@
 # test_char_list.py
+import asyncio
+import gc
+import io
+import json
+import os
+import pickle
+import random
+import tempfile
+import threading
+import tracemalloc
 import unittest
-from char_array_list import CharArrayList
+from unittest import mock
+from contextlib import nullcontext
+import char_instrumentation
+import char_parallel
+from char_adaptive_list import CharAdaptiveList
+from char_array_list import CharArrayList, STORAGE_COMPACT
+from char_concurrent_list import ConcurrentCharList, ReadWriteLock
 from char_doubly_linked_list import CharDoublyLinkedList
+from char_gap_buffer_list import CharGapBufferList
+from char_parallel import ParallelSearch
+from char_rope_list import CharRopeList, LEAF_SIZE
+from char_unrolled_linked_list import CharUnrolledLinkedList
+from char_versioned_list import CharVersionedList
 
 
 class ListTestsMixin:
@@ -145,6 +166,32 @@ class ListTestsMixin:
         self.assertIsNot(self.empty_list, empty_clone)
         self.assertEqual(empty_clone.length(), 0)
 
+    def test_clone_isolation(self):
+        mutations = [
+            lambda lst: lst.append("z"),
+            lambda lst: lst.insert("z", 1),
+            lambda lst: lst.delete(0),
+            lambda lst: lst.deleteAll("b"),
+            lambda lst: lst.reverse(),
+            lambda lst: lst.clear(),
+            lambda lst: lst.extend(self.ListClass("zz")),
+            lambda lst: lst.extend_from_str("zz"),
+        ]
+        for mutate in mutations:
+            source = self.ListClass("abcb")
+            clone = source.clone()
+            mutate(clone)
+            self.assertEqual(source.to_string(), "abcb")
+            mutate(source)
+            self.assertEqual(source.to_string(), clone.to_string())
+
+            source = self.ListClass("abcb")
+            clone = source.clone()
+            second_clone = clone.clone()
+            mutate(source)
+            self.assertEqual(clone.to_string(), "abcb")
+            self.assertEqual(second_clone.to_string(), "abcb")
+
     def test_reverse(self):
         lst = self.ListClass("abcde")
         lst.reverse()
@@ -218,6 +265,137 @@ class ListTestsMixin:
         with self.assertRaises(TypeError):
             lst_a.extend("not a list object")
 
+    def test_bulk_string_api(self):
+        lst = self.ListClass.from_string("hello")
+        self.assertIsInstance(lst, self.ListClass)
+        self.assertEqual(lst.length(), 5)
+        self.assertEqual(lst.get(4), "o")
+        lst.extend_from_str(", world")
+        self.assertEqual(lst.length(), 12)
+        self.assertEqual(lst.to_string(), "hello, world")
+        lst.extend_from_str("")
+        self.assertEqual(lst.length(), 12)
+        self.assertEqual(self.empty_list.to_string(), "")
+
+        with self.assertRaises(TypeError):
+            self.ListClass.from_string(["a"])
+        with self.assertRaises(TypeError):
+            lst.extend_from_str(None)
+
+    def test_bulk_list_validation(self):
+        self.assertEqual(self.ListClass(["a", "b", "c"]).to_string(), "abc")
+        with self.assertRaises(TypeError):
+            self.ListClass(["", "ab"])
+        with self.assertRaises(TypeError):
+            self.ListClass(["a", None])
+
+    def test_extend_with_itself(self):
+        lst = self.ListClass("ab")
+        lst.extend(lst)
+        self.assertEqual(lst.to_string(), "abab")
+        self.assertEqual(lst.get(3), "b")
+
+    def test_sequence_protocol(self):
+        self.assertEqual(len(self.list2), 4)
+        self.assertEqual(len(self.empty_list), 0)
+        self.assertEqual(list(self.list2), ["x", "y", "z", "y"])
+        self.assertEqual(list(self.empty_list), [])
+        self.assertEqual(self.list2[0], "x")
+        self.assertEqual(self.list2[-1], "y")
+        with self.assertRaises(IndexError):
+            self.list2[4]
+        with self.assertRaises(IndexError):
+            self.list2[-5]
+        with self.assertRaises(TypeError):
+            self.list2["0"]
+
+        self.assertIn("z", self.list2)
+        self.assertNotIn("a", self.list2)
+        self.assertNotIn("xy", self.list2)
+        self.assertNotIn(1, self.list2)
+
+    def test_slicing(self):
+        lst = self.ListClass("abcdef")
+        middle = lst[1:4]
+        self.assertEqual(middle.to_string(), "bcd")
+        self.assertEqual(lst[::-2].to_string(), "fdb")
+        self.assertEqual(lst[4:2].length(), 0)
+        self.assertEqual(lst[-2:].to_string(), "ef")
+        middle.append("x")
+        self.assertEqual(lst.to_string(), "abcdef")
+
+    def test_count_and_find_all(self):
+        lst = self.ListClass("abracadabra")
+        self.assertEqual(lst.count("a"), 5)
+        self.assertEqual(lst.count("z"), 0)
+        self.assertEqual(lst.find_all("a"), [0, 3, 5, 7, 10])
+        self.assertEqual(lst.find_all("r"), [2, 9])
+        self.assertEqual(lst.find_all("z"), [])
+        self.assertEqual(self.empty_list.find_all("a"), [])
+        self.assertEqual(self.empty_list.count("a"), 0)
+        with self.assertRaises(TypeError):
+            lst.count("ab")
+        with self.assertRaises(TypeError):
+            lst.find_all(1)
+
+    def test_find_substring(self):
+        lst = self.ListClass("abracadabra")
+        self.assertEqual(lst.find_substring("cad"), 4)
+        self.assertEqual(lst.find_substring("abra"), 0)
+        self.assertEqual(lst.find_substring("a"), 0)
+        self.assertEqual(lst.find_substring("dab"), 6)
+        self.assertEqual(lst.find_substring("zz"), -1)
+        self.assertEqual(lst.find_substring("\u044f"), -1)
+        self.assertEqual(self.empty_list.find_substring("a"), -1)
+        with self.assertRaises(ValueError):
+            lst.find_substring("")
+        with self.assertRaises(TypeError):
+            lst.find_substring(None)
+
+    def test_batch_matches_sequential_edits(self):
+        edits = [
+            ("insert", ("x", 0)),
+            ("delete", (3,)),
+            ("append", ("y",)),
+            ("insert", ("z", 4)),
+            ("delete", (0,)),
+            ("insert", ("w", 2)),
+        ]
+        sequential = self.ListClass("abcdef")
+        batched = self.ListClass("abcdef")
+        with batched.batch() as batch:
+            for operation, arguments in edits:
+                getattr(sequential, operation)(*arguments)
+                getattr(batch, operation)(*arguments)
+            self.assertEqual(len(batch), len(edits))
+            self.assertEqual(batched.to_string(), "abcdef")
+        self.assertEqual(batched.to_string(), sequential.to_string())
+        self.assertEqual(batched.length(), sequential.length())
+        self.assertEqual(batched.get(batched.length() - 1), "y")
+
+    def test_batch_rolls_back_on_invalid_edit(self):
+        lst = self.ListClass("abc")
+        batch = lst.batch()
+        batch.insert("x", 1)
+        batch.delete(3)
+        batch.delete(4)
+        with self.assertRaises(IndexError):
+            batch.commit()
+        self.assertEqual(lst.to_string(), "abc")
+        self.assertEqual(len(batch), 0)
+
+        with self.assertRaises(TypeError):
+            with lst.batch() as batch:
+                batch.append("q")
+                batch.insert("xy", 0)
+        self.assertEqual(lst.to_string(), "abc")
+
+        with self.assertRaises(KeyError):
+            with lst.batch() as batch:
+                batch.append("q")
+                raise KeyError("abort")
+        self.assertEqual(lst.to_string(), "abc")
+
     def test_str_repr(self):
         self.assertTrue(isinstance(str(self.list1), str))
         self.assertTrue(isinstance(repr(self.list1), str))
@@ -229,9 +407,1245 @@ class TestCharArrayList(ListTestsMixin, unittest.TestCase):
     ListClass = CharArrayList
 
 
+class CompactCharArrayList(CharArrayList):
+    def __init__(self, initial_elements=None, storage=STORAGE_COMPACT):
+        super().__init__(initial_elements, storage=storage)
+
+
+class TestCompactCharArrayList(ListTestsMixin, unittest.TestCase):
+    ListClass = CompactCharArrayList
+
+    def test_storage_selection(self):
+        self.assertEqual(CharArrayList("ab").storage, "list")
+        self.assertEqual(self.list1.storage, STORAGE_COMPACT)
+        self.assertEqual(self.list1.clone().storage, STORAGE_COMPACT)
+        with self.assertRaises(ValueError):
+            CharArrayList("ab", storage="rope")
+
+    def test_widens_beyond_latin1(self):
+        lst = self.ListClass("caf\u00e9")
+        self.assertFalse(lst._data.is_wide)
+        lst.insert("\u044f", 1)
+        lst.append("\U0001f600")
+        self.assertTrue(lst._data.is_wide)
+        self.assertEqual(lst.length(), 6)
+        self.assertEqual(lst.get(1), "\u044f")
+        self.assertEqual(lst.get(5), "\U0001f600")
+        self.assertEqual(lst.findLast("\u044f"), 1)
+        self.assertEqual(lst.findFirst("\u00e9"), 4)
+        self.assertEqual(lst.count("\u044f"), 1)
+        self.assertEqual(lst.find_all("\U0001f600"), [5])
+        self.assertEqual(lst.find_substring("f\u00e9"), 3)
+        lst.deleteAll("\u044f")
+        self.assertEqual(lst.length(), 5)
+        self.assertEqual(lst.delete(4), "\U0001f600")
+
+    def test_buffer_export(self):
+        lst = self.ListClass("abc")
+        self.assertEqual(lst.buffer_encoding, "latin-1")
+        self.assertEqual(bytes(lst.as_buffer()), b"abc")
+        lst.append("\u044f")
+        buffer = lst.as_buffer()
+        self.assertEqual(buffer.tobytes().decode(lst.buffer_encoding), "abc\u044f")
+        buffer.release()
+        with self.assertRaises(TypeError):
+            CharArrayList("abc").as_buffer()
+
+    def test_buffer_export_is_read_only(self):
+        lst = self.ListClass("abc")
+        buffer = lst.as_buffer()
+        snapshot = lst.clone()
+        self.assertTrue(buffer.readonly)
+        with self.assertRaises(TypeError):
+            buffer[0] = ord("z")
+        buffer.release()
+        lst.append("\u044f")
+        self.assertEqual(snapshot.to_string(), "abc")
+        self.assertEqual(lst.to_string(), "abc\u044f")
+
+    def test_latin1_search_for_wide_char(self):
+        self.assertEqual(self.list1.count("\u044f"), 0)
+        self.assertEqual(self.list1.find_all("\u044f"), [])
+        self.assertEqual(self.list1.findFirst("\u044f"), -1)
+        self.assertEqual(self.list1.findLast("\u044f"), -1)
+        self.list1.deleteAll("\u044f")
+        self.assertEqual(self.list1.length(), 3)
+
+
 class TestCharDoublyLinkedList(ListTestsMixin, unittest.TestCase):
     ListClass = CharDoublyLinkedList
 
 
+class TestCharRopeList(ListTestsMixin, unittest.TestCase):
+    ListClass = CharRopeList
+
+    def test_clone_shares_structure(self):
+        lst = self.ListClass("x" * (LEAF_SIZE * 8))
+        clone = lst.clone()
+        self.assertIs(clone._root, lst._root)
+        clone.insert("y", LEAF_SIZE * 4)
+        self.assertIsNot(clone._root, lst._root)
+        self.assertEqual(lst.findFirst("y"), -1)
+        self.assertEqual(clone.findFirst("y"), LEAF_SIZE * 4)
+
+    def test_stays_balanced(self):
+        lst = self.ListClass()
+        for i in range(LEAF_SIZE * 64):
+            lst.insert("ab"[i % 2], lst.length() // 2)
+        self.assertEqual(lst.length(), LEAF_SIZE * 64)
+        self.assertLessEqual(lst._root.height, 12)
+        self.assertEqual(lst.get(0), "b")
+        self.assertEqual(lst.findLast("a"), lst.length() - 1)
+
+
+class TestCharUnrolledLinkedList(ListTestsMixin, unittest.TestCase):
+    ListClass = CharUnrolledLinkedList
+
+    def test_small_blocks_split_and_merge(self):
+        lst = self.ListClass(block_size=4)
+        expected = []
+        for i in range(40):
+            char_element = "abcde"[i % 5]
+            lst.insert(char_element, i // 2)
+            expected.insert(i // 2, char_element)
+        self.assertEqual(lst.to_string(), "".join(expected))
+        self.assertTrue(all(0 < len(block.data) <= 4 for block in lst._iter_blocks()))
+
+        while expected:
+            index = len(expected) // 3
+            self.assertEqual(lst.delete(index), expected.pop(index))
+            self.assertEqual(lst.to_string(), "".join(expected))
+        self.assertIsNone(lst.head)
+        self.assertIsNone(lst.tail)
+
+    def test_reverse_and_search_across_blocks(self):
+        lst = self.ListClass.from_string("abcdefghij", block_size=3)
+        lst.reverse()
+        self.assertEqual(lst.to_string(), "jihgfedcba")
+        self.assertEqual(lst.get(4), "f")
+        self.assertEqual(lst.findFirst("c"), 7)
+        lst.extend(self.ListClass("cc", block_size=2))
+        self.assertEqual(lst.findLast("c"), 11)
+        self.assertEqual(lst.block_size, 3)
+        with self.assertRaises(ValueError):
+            self.ListClass(block_size=1)
+
+
+class TestCharGapBufferList(ListTestsMixin, unittest.TestCase):
+    ListClass = CharGapBufferList
+
+    def test_gap_follows_edits(self):
+        lst = self.ListClass("abcdefgh")
+        self.assertEqual(lst.gap_position, 8)
+        lst.insert("x", 3)
+        self.assertEqual(lst.gap_position, 4)
+        lst.insert("y", 4)
+        lst.delete(5)
+        self.assertEqual(lst.gap_position, 5)
+        self.assertEqual(lst.to_string(), "abcxyefgh")
+        self.assertEqual([lst.get(i) for i in range(lst.length())], list("abcxyefgh"))
+        self.assertEqual(lst.gap_position, 5)
+        lst.append("z")
+        self.assertEqual(lst.gap_position, lst.length())
+
+    def test_reverse_and_search_around_gap(self):
+        lst = self.ListClass("abcabc")
+        lst.insert("x", 2)
+        lst.reverse()
+        self.assertEqual(lst.to_string(), "cbacxba")
+        self.assertEqual(lst.findFirst("a"), 2)
+        self.assertEqual(lst.findLast("c"), 3)
+        self.assertEqual(lst.find_all("b"), [1, 5])
+        self.assertEqual(lst[-1], "a")
+
+
+class TestCharAdaptiveList(ListTestsMixin, unittest.TestCase):
+    ListClass = CharAdaptiveList
+
+    def test_switches_with_workload(self):
+        lst = self.ListClass("x" * 5000, window=32)
+        expected = ["x"] * 5000
+        for _ in range(64):
+            lst.insert("a", 0)
+            expected.insert(0, "a")
+        self.assertEqual(lst.representation, "gap")
+        for i in range(64):
+            index = 0 if i % 2 else lst.length()
+            lst.insert("b", index)
+            expected.insert(index, "b")
+        self.assertEqual(lst.representation, "linked")
+        for i in range(64):
+            self.assertEqual(lst.get(i * 71), expected[i * 71])
+        self.assertEqual(lst.representation, "array")
+        self.assertEqual(lst.migrations, 3)
+        self.assertEqual(lst.to_string(), "".join(expected))
+
+    def test_small_or_balanced_workloads_stay_put(self):
+        lst = self.ListClass("abc", window=8)
+        for _ in range(40):
+            lst.insert("z", 0)
+            lst.get(1)
+        self.assertEqual(lst.representation, "array")
+        self.assertEqual(lst.migrations, 0)
+        self.assertEqual(lst.clone().representation, "array")
+
+    def test_configuration(self):
+        lst = self.ListClass("abc", representation="linked")
+        lst.migrate("gap")
+        self.assertEqual(lst.representation, "gap")
+        self.assertEqual(lst[1:].to_string(), "bc")
+        self.assertEqual(lst[1:].representation, "gap")
+        with self.assertRaises(ValueError):
+            self.ListClass(representation="tree")
+        with self.assertRaises(ValueError):
+            self.ListClass(window=0)
+        with self.assertRaises(ValueError):
+            lst.migrate("tree")
+
+
+class TestCharVersionedList(ListTestsMixin, unittest.TestCase):
+    ListClass = CharVersionedList
+
+    def test_undo_redo(self):
+        lst = self.ListClass("abc")
+        lst.insert("x", 1)
+        lst.delete(0)
+        lst.reverse()
+        self.assertEqual(lst.to_string(), "cbx")
+        self.assertEqual(lst.version, 3)
+
+        lst.undo()
+        self.assertEqual(lst.to_string(), "xbc")
+        lst.undo()
+        lst.undo()
+        self.assertEqual(lst.to_string(), "abc")
+        self.assertFalse(lst.can_undo)
+        with self.assertRaises(IndexError):
+            lst.undo()
+
+        lst.redo()
+        self.assertEqual(lst.to_string(), "axbc")
+        lst.append("q")
+        self.assertFalse(lst.can_redo)
+        with self.assertRaises(IndexError):
+            lst.redo()
+        self.assertEqual(lst.latest_version, 2)
+
+    def test_noop_edits_do_not_create_versions(self):
+        lst = self.ListClass("abc")
+        lst.deleteAll("z")
+        lst.extend_from_str("")
+        self.assertEqual(lst.version, 0)
+
+    def test_batch_is_one_version(self):
+        lst = self.ListClass("abc")
+        with lst.batch() as batch:
+            batch.append("d")
+            batch.delete(0)
+        self.assertEqual(lst.version, 1)
+        lst.undo()
+        self.assertEqual(lst.to_string(), "abc")
+
+    def test_snapshots_and_checkout(self):
+        lst = self.ListClass("a" * 1000)
+        for i in range(100):
+            lst.insert("b", i * 10)
+        self.assertEqual(lst.snapshot(0).to_string(), "a" * 1000)
+        self.assertEqual(lst.snapshot(50).count("b"), 50)
+        self.assertIsInstance(lst.snapshot(), CharRopeList)
+        lst.checkout(10)
+        self.assertEqual(lst.count("b"), 10)
+        self.assertTrue(lst.can_redo)
+        with self.assertRaises(IndexError):
+            lst.snapshot(101)
+        with self.assertRaises(TypeError):
+            lst.checkout("1")
+
+    def test_max_versions(self):
+        lst = self.ListClass("", max_versions=3)
+        for char_element in "abcde":
+            lst.append(char_element)
+        self.assertEqual(lst.version, 5)
+        self.assertEqual(lst.oldest_version, 3)
+        lst.undo()
+        lst.undo()
+        self.assertEqual(lst.to_string(), "abc")
+        self.assertFalse(lst.can_undo)
+        with self.assertRaises(IndexError):
+            lst.checkout(2)
+        with self.assertRaises(ValueError):
+            self.ListClass(max_versions=0)
+
+
+class TestCopyOnWriteClone(unittest.TestCase):
+    def test_array_clone_shares_storage_until_write(self):
+        for storage in ("list", STORAGE_COMPACT):
+            source = CharArrayList("abc", storage=storage)
+            clone = source.clone()
+            self.assertIs(clone._data, source._data)
+            clone.append("d")
+            self.assertIsNot(clone._data, source._data)
+            self.assertEqual(source.to_string(), "abc")
+            source_data = source._data
+            source.append("e")
+            self.assertIs(source._data, source_data)
+
+    def test_linked_clone_shares_nodes_until_write(self):
+        source = CharDoublyLinkedList("abc")
+        original_head = source.head
+        clone = source.clone()
+        self.assertIs(clone.head, original_head)
+        source.delete(1)
+        self.assertIsNot(source.head, original_head)
+        self.assertIs(clone.head, original_head)
+        self.assertEqual(clone.to_string(), "abc")
+        clone.append("d")
+        self.assertIs(clone.head, original_head)
+        self.assertEqual(source.to_string(), "ac")
+
+    def test_dropped_clone_releases_share(self):
+        for source in (
+            CharArrayList("abc"),
+            CharArrayList("abc", storage=STORAGE_COMPACT),
+        ):
+            with self.subTest(storage=source.storage):
+                clone = source.clone()
+                self.assertEqual(source._share_count, [2])
+                del clone
+                gc.collect()
+                self.assertEqual(source._share_count, [1])
+                source_data = source._data
+                source.append("d")
+                self.assertIs(source._data, source_data)
+        source = CharDoublyLinkedList("abc")
+        original_head = source.head
+        clone = source.clone()
+        del clone
+        gc.collect()
+        self.assertEqual(source._share_count, [1])
+        source.append("d")
+        self.assertIs(source.head, original_head)
+        survivor = source.clone()
+        del source
+        gc.collect()
+        self.assertEqual(survivor._share_count, [1])
+        self.assertEqual(survivor.to_string(), "abcd")
+
+    def test_detached_clone_does_not_release_source_share(self):
+        source = CharDoublyLinkedList("abc")
+        first = source.clone()
+        second = source.clone()
+        first.append("x")
+        del first
+        gc.collect()
+        self.assertEqual(source._share_count, [2])
+        self.assertIs(second.head, source.head)
+
+    def test_linked_deleteAll_without_match_keeps_shared_nodes(self):
+        source = CharDoublyLinkedList("abc")
+        clone = source.clone()
+        original_head = source.head
+        source.deleteAll("z")
+        self.assertIs(source.head, original_head)
+        self.assertIs(clone.head, original_head)
+        self.assertEqual(source._share_count, [2])
+        source.deleteAll("b")
+        self.assertEqual(source.to_string(), "ac")
+        self.assertEqual(clone.to_string(), "abc")
+
+    def test_cursor_survives_copy_on_write(self):
+        source = CharDoublyLinkedList("abc")
+        cursor = source.cursor(1)
+        snapshot = source.clone()
+        cursor.insert_here("x")
+        self.assertEqual(cursor.get(), "b")
+        self.assertEqual(cursor.delete_here(), "b")
+        self.assertEqual(source.to_string(), "axc")
+        self.assertEqual(snapshot.to_string(), "abc")
+
+
+class TestCharDoublyLinkedListCursor(unittest.TestCase):
+    def test_editor_session(self):
+        lst = CharDoublyLinkedList("hllo")
+        cursor = lst.cursor(1)
+        self.assertEqual(cursor.get(), "l")
+        cursor.insert_here("e")
+        self.assertEqual(cursor.index, 2)
+        self.assertEqual(cursor.get(), "l")
+        cursor.move(2)
+        cursor.move(1)
+        self.assertTrue(cursor.at_end)
+        for char_element in " world":
+            cursor.insert_here(char_element)
+        self.assertEqual(lst.to_string(), "hello world")
+        self.assertEqual(lst.tail.data, "d")
+
+        cursor.move(-1)
+        self.assertEqual(cursor.delete_here(), "d")
+        self.assertTrue(cursor.at_end)
+        cursor.move(-lst.length())
+        self.assertEqual(cursor.index, 0)
+        self.assertEqual(cursor.delete_here(), "h")
+        self.assertEqual(lst.to_string(), "ello worl")
+        self.assertEqual("".join(cursor), "ello worl")
+        self.assertEqual(lst.head.data, "e")
+        self.assertEqual(lst.length(), 9)
+
+    def test_bounds(self):
+        lst = CharDoublyLinkedList("ab")
+        cursor = lst.cursor(2)
+        with self.assertRaises(IndexError):
+            cursor.get()
+        with self.assertRaises(IndexError):
+            cursor.delete_here()
+        with self.assertRaises(IndexError):
+            cursor.move(1)
+        with self.assertRaises(IndexError):
+            cursor.move(-3)
+        with self.assertRaises(TypeError):
+            cursor.move("1")
+        with self.assertRaises(TypeError):
+            cursor.insert_here("xy")
+        with self.assertRaises(IndexError):
+            lst.cursor(3)
+        empty_cursor = CharDoublyLinkedList().cursor()
+        empty_cursor.insert_here("z")
+        self.assertEqual(empty_cursor.index, 1)
+
+    def test_invalidated_by_other_mutations(self):
+        lst = CharDoublyLinkedList("abc")
+        cursor = lst.cursor(1)
+        lst.append("d")
+        with self.assertRaises(RuntimeError):
+            cursor.get()
+        with self.assertRaises(RuntimeError):
+            cursor.move(1)
+
+        other = lst.cursor(0)
+        iterator = iter(other)
+        self.assertEqual(next(iterator), "a")
+        lst.delete(3)
+        with self.assertRaises(RuntimeError):
+            next(iterator)
+
+    def test_own_edits_keep_cursor_valid(self):
+        lst = CharDoublyLinkedList("abc")
+        first = lst.cursor(0)
+        first.delete_here()
+        first.insert_here("x")
+        self.assertEqual(first.get(), "b")
+        self.assertEqual(lst.to_string(), "xbc")
+
+
+class TestCharDoublyLinkedListNodes(unittest.TestCase):
+    def test_nodes_have_no_dict(self):
+        lst = CharDoublyLinkedList("ab")
+        self.assertFalse(hasattr(lst.head, "__dict__"))
+
+    def test_node_pool_reuses_deleted_nodes(self):
+        lst = CharDoublyLinkedList("abcd", node_pool_size=2)
+        deleted_node = lst._get_node_at_index(1)
+        lst.delete(1)
+        lst.delete(0)
+        lst.delete(0)
+        self.assertEqual(len(lst._free_nodes), 2)
+        lst.append("x")
+        lst.extend_from_str("yz")
+        self.assertEqual(lst._free_nodes, [])
+        self.assertIn(deleted_node, list(lst._iter_nodes()))
+        self.assertEqual(lst.to_string(), "dxyz")
+        self.assertIsNone(lst.head.prev)
+        self.assertIsNone(lst.tail.next)
+        with self.assertRaises(ValueError):
+            CharDoublyLinkedList(node_pool_size=-1)
+
+    def test_deleteAll_relinks_runs(self):
+        lst = CharDoublyLinkedList("aabaacaa", node_pool_size=8)
+        lst.deleteAll("a")
+        self.assertEqual(lst.to_string(), "bc")
+        self.assertEqual(lst.head.data, "b")
+        self.assertIs(lst.head.next, lst.tail)
+        self.assertIs(lst.tail.prev, lst.head)
+        self.assertEqual(len(lst._free_nodes), 6)
+
+    def test_clear_unlinks_owned_chain(self):
+        lst = CharDoublyLinkedList("abc", node_pool_size=2)
+        nodes = list(lst._iter_nodes())
+        lst.clear()
+        self.assertIsNone(lst.head)
+        for node in nodes:
+            self.assertIsNone(node.prev)
+        self.assertEqual(lst._free_nodes, nodes[:2])
+        self.assertIsNone(nodes[1].next)
+        lst.append("z")
+        self.assertEqual(lst.to_string(), "z")
+
+    def test_clear_frees_nodes_without_cycle_collection(self):
+        gc.disable()
+        try:
+            tracemalloc.start()
+            lst = CharDoublyLinkedList("a" * 10_000)
+            lst.clear()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            gc.enable()
+        self.assertLess(current, 100_000)
+
+    def test_clear_keeps_shared_chain_intact(self):
+        lst = CharDoublyLinkedList("abc")
+        snapshot = lst.clone()
+        first_node = lst.head
+        lst.clear()
+        self.assertIsNone(lst.head)
+        self.assertIs(first_node.next.prev, first_node)
+        self.assertEqual(snapshot.to_string(), "abc")
+        lst.append("z")
+        self.assertEqual(lst.to_string(), "z")
+
+
+class TestCharDoublyLinkedListFinger(unittest.TestCase):
+    def test_sequential_get_reuses_finger(self):
+        lst = CharDoublyLinkedList("abcdefghij")
+        for i in range(lst.length()):
+            self.assertEqual(lst.get(i), "abcdefghij"[i])
+            self.assertEqual(lst._finger_index, i)
+
+    def test_finger_follows_mutations(self):
+        expected = list("abcdefghij")
+        lst = CharDoublyLinkedList(expected)
+        lst.get(5)
+        lst.insert("x", 2)
+        expected.insert(2, "x")
+        self.assertEqual(lst.get(6), expected[6])
+        lst.delete(6)
+        del expected[6]
+        self.assertEqual(lst.get(6), expected[6])
+        lst.delete(1)
+        del expected[1]
+        self.assertEqual(lst.get(4), expected[4])
+        lst.reverse()
+        expected.reverse()
+        self.assertEqual(lst.get(4), expected[4])
+        self.assertEqual(lst.get(5), expected[5])
+        lst.deleteAll("e")
+        expected = [item for item in expected if item != "e"]
+        self.assertEqual(lst.get(4), expected[4])
+        cursor = lst.cursor(1)
+        cursor.insert_here("y")
+        expected.insert(1, "y")
+        cursor.delete_here()
+        del expected[2]
+        for i, item in enumerate(expected):
+            self.assertEqual(lst.get(i), item)
+        lst.clear()
+        self.assertIsNone(lst._finger_node)
+
+
+class TestLazyReverse(unittest.TestCase):
+    factories = (CharArrayList, CompactCharArrayList, CharDoublyLinkedList)
+
+    def test_reverse_only_flips_direction(self):
+        for factory in self.factories:
+            with self.subTest(factory=factory.__name__):
+                lst = factory("abcde")
+                lst.reverse()
+                self.assertTrue(lst.is_reversed)
+                self.assertEqual(lst.to_string(), "edcba")
+                lst.reverse()
+                self.assertFalse(lst.is_reversed)
+                self.assertEqual(lst.to_string(), "abcde")
+
+    def test_edits_while_reversed(self):
+        for factory in self.factories:
+            with self.subTest(factory=factory.__name__):
+                expected = list("abcdef")
+                lst = factory(expected)
+                lst.reverse()
+                expected.reverse()
+                lst.insert("x", 0)
+                expected.insert(0, "x")
+                lst.insert("y", 3)
+                expected.insert(3, "y")
+                lst.append("z")
+                expected.append("z")
+                lst.extend_from_str("uv")
+                expected.extend("uv")
+                self.assertEqual(lst.delete(4), expected.pop(4))
+                self.assertEqual(list(lst), expected)
+                self.assertEqual(lst[1:5].to_string(), "".join(expected[1:5]))
+                self.assertEqual(lst.findFirst("a"), expected.index("a"))
+                self.assertEqual(lst.findLast("y"), expected.index("y"))
+                self.assertEqual(lst.find_all("u"), [expected.index("u")])
+                lst.materialize()
+                self.assertFalse(lst.is_reversed)
+                self.assertEqual(lst.to_string(), "".join(expected))
+
+    def test_reversed_clone_isolation(self):
+        for factory in self.factories:
+            with self.subTest(factory=factory.__name__):
+                lst = factory("abc")
+                lst.reverse()
+                copy = lst.clone()
+                self.assertEqual(copy.to_string(), "cba")
+                lst.materialize()
+                lst.append("d")
+                copy.reverse()
+                self.assertEqual(lst.to_string(), "cbad")
+                self.assertEqual(copy.to_string(), "abc")
+
+    def test_cursor_walks_reversed_list(self):
+        lst = CharDoublyLinkedList("abcde")
+        lst.reverse()
+        cursor = lst.cursor(1)
+        self.assertEqual(cursor.get(), "d")
+        cursor.insert_here("x")
+        self.assertEqual(lst.to_string(), "exdcba")
+        cursor.move(1)
+        self.assertEqual(cursor.delete_here(), "c")
+        self.assertEqual("".join(cursor), "ba")
+        self.assertEqual(lst.to_string(), "exdba")
+
+
+class TestStreamingFileIO(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _write(self, text, encoding="utf-8"):
+        with open(self.path, "w", encoding=encoding, newline="") as text_file:
+            text_file.write(text)
+
+    def test_round_trip_in_chunks(self):
+        text = "line one\r\nдругий рядок\n" * 50
+        self._write(text)
+        loaders = (
+            CharArrayList.from_file,
+            lambda *args, **kwargs: CharArrayList.from_file(
+                *args, storage=STORAGE_COMPACT, **kwargs
+            ),
+            CharDoublyLinkedList.from_file,
+        )
+        for load in loaders:
+            with self.subTest(load=load):
+                lst = load(self.path, chunk_size=7)
+                self.assertEqual(lst.to_string(), text)
+                output = io.StringIO()
+                self.assertEqual(lst.write_to(output, chunk_size=13), len(text))
+                self.assertEqual(output.getvalue(), text)
+                self.assertTrue(all(len(c) <= 13 for c in lst.iter_chunks(13)))
+
+    def test_latin1_compact_load_uses_bytes(self):
+        text = "café\x00\xff" * 10
+        self._write(text, encoding="latin-1")
+        lst = CharArrayList.from_file(
+            self.path, encoding="latin-1", storage=STORAGE_COMPACT
+        )
+        self.assertEqual(lst.to_string(), text)
+        self.assertEqual(lst.buffer_encoding, "latin-1")
+        lst.append("ĳ")
+        self.assertEqual(lst.to_string(), text + "ĳ")
+
+    def test_empty_file(self):
+        self.assertEqual(CharArrayList.from_file(self.path).length(), 0)
+        compact = CharArrayList.from_file(
+            self.path, encoding="latin-1", storage=STORAGE_COMPACT
+        )
+        self.assertEqual(compact.length(), 0)
+        self.assertEqual(CharDoublyLinkedList.from_file(self.path).length(), 0)
+
+    def test_write_reversed_list(self):
+        for lst in (
+            CharArrayList("abcdefg"),
+            CharArrayList("abcdefg", storage=STORAGE_COMPACT),
+            CharDoublyLinkedList("abcdefg"),
+        ):
+            with self.subTest(lst=lst):
+                lst.reverse()
+                self.assertEqual(list(lst.iter_chunks(3)), ["gfe", "dcb", "a"])
+
+    def test_invalid_chunk_size(self):
+        for lst in (CharArrayList("ab"), CharDoublyLinkedList("ab")):
+            with self.assertRaises(ValueError):
+                lst.write_to(io.StringIO(), chunk_size=0)
+        with self.assertRaises(ValueError):
+            CharDoublyLinkedList.from_file(self.path, chunk_size=-1)
+        with self.assertRaises(ValueError):
+            CharArrayList.from_file(
+                self.path, "latin-1", storage=STORAGE_COMPACT, chunk_size=0
+            )
+
+
+class TestConcurrentCharList(ListTestsMixin, unittest.TestCase):
+    ListClass = ConcurrentCharList
+
+    def test_snapshot_is_isolated(self):
+        lst = ConcurrentCharList("abc")
+        snapshot = lst.snapshot()
+        self.assertIs(lst.snapshot()._root, lst.snapshot()._root)
+        self.assertIsNotNone(lst._snapshot)
+        lst.append("d")
+        self.assertIsNone(lst._snapshot)
+        snapshot.append("x")
+        self.assertEqual(lst.to_string(), "abcd")
+        self.assertEqual(snapshot.to_string(), "abcx")
+        self.assertEqual(list(lst), ["a", "b", "c", "d"])
+
+    def test_writer_waits_for_readers(self):
+        lock = ReadWriteLock()
+        lock.acquire_read()
+        lock.acquire_read()
+        acquired = threading.Event()
+
+        def write():
+            with lock.write_locked():
+                acquired.set()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        self.assertFalse(acquired.wait(0.05))
+        lock.release_read()
+        self.assertFalse(acquired.wait(0.05))
+        lock.release_read()
+        self.assertTrue(acquired.wait(5))
+        writer.join()
+
+    def test_stress_keeps_structure_consistent(self):
+        list_classes = {
+            "array": CharArrayList,
+            "linked": CharDoublyLinkedList,
+            "adaptive": CharAdaptiveList,
+            "adaptive_linked": lambda elements=None: CharAdaptiveList(
+                elements, representation="linked", switch_ratio=1e18
+            ),
+        }
+        for name, list_class in list_classes.items():
+            with self.subTest(list_class=name):
+                lst = ConcurrentCharList("a" * 200, list_class)
+                errors = []
+
+                def mutate(seed):
+                    try:
+                        for i in range(300):
+                            lst.append("b")
+                            lst.insert("c", (seed * 31 + i) % 50)
+                            lst.delete(0)
+                            lst.delete(lst.length() // 2)
+                    except Exception as error:
+                        errors.append(error)
+
+                def read():
+                    try:
+                        for i in range(300):
+                            lst.get(i % 100)
+                            lst.findLast("c")
+                            snapshot = lst.snapshot()
+                            if len(snapshot.to_string()) != snapshot.length():
+                                errors.append(snapshot)
+                            lst[10:20]
+                    except Exception as error:
+                        errors.append(error)
+
+                threads = [
+                    threading.Thread(target=mutate, args=(seed,)) for seed in range(4)
+                ] + [threading.Thread(target=read) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                self.assertEqual(errors, [])
+                self.assertEqual(lst.length(), 200)
+                text = lst.to_string()
+                self.assertEqual(len(text), 200)
+                self.assertEqual(list(lst), list(text))
+                if name == "linked":
+                    nodes = list(lst._list._iter_nodes())
+                    self.assertEqual(len(nodes), 200)
+                    self.assertIs(lst._list.tail, nodes[-1])
+                    for previous, node in zip(nodes, nodes[1:]):
+                        self.assertIs(node.prev, previous)
+
+    def test_reads_serialized_for_lists_that_mutate_on_read(self):
+        self.assertIsInstance(ConcurrentCharList("ab")._read_mutex, nullcontext)
+        for list_class in (CharDoublyLinkedList, CharAdaptiveList):
+            with self.subTest(list_class=list_class.__name__):
+                lst = ConcurrentCharList("ab", list_class)
+                self.assertNotIsInstance(lst._read_mutex, nullcontext)
+
+
+class TestParallelSearch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.window = mock.patch.object(char_parallel, "SERIAL_WINDOW", 16)
+        cls.window.start()
+        cls.search = ParallelSearch(max_workers=2, threshold=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.search.close()
+        cls.window.stop()
+
+    def test_merges_shard_results(self):
+        text = "xyz" * 300 + "a" + "xyz" * 200 + "a" + "xyz" * 100
+        for storage in (None, STORAGE_COMPACT):
+            for sample in (text, text + "ω"):
+                with self.subTest(storage=storage, wide=sample != text):
+                    if storage is None:
+                        lst = CharArrayList(sample)
+                    else:
+                        lst = CharArrayList.from_string(sample, storage=storage)
+                    self.assertEqual(self.search.find_first(lst, "a"), 900)
+                    self.assertEqual(self.search.find_last(lst, "a"), 1501)
+                    self.assertEqual(self.search.find_first(lst, "q"), -1)
+                    self.assertEqual(self.search.find_last(lst, "q"), -1)
+                    self.search.delete_all(lst, "y")
+                    self.assertEqual(lst.to_string(), sample.replace("y", ""))
+                    with self.assertRaises(TypeError):
+                        self.search.find_first(lst, "ab")
+
+    def test_early_hits_and_list_storage_never_share(self):
+        text = "a" + "\u03c9" * 100 + "b"
+        compact = CharArrayList.from_string(text, storage=STORAGE_COMPACT)
+        with mock.patch.object(
+            ParallelSearch, "_share", side_effect=AssertionError
+        ) as share:
+            self.assertEqual(self.search.find_first(compact, "a"), 0)
+            self.assertEqual(self.search.find_last(compact, "b"), 101)
+            compact.reverse()
+            self.assertEqual(self.search.find_first(compact, "b"), 0)
+            self.assertEqual(self.search.find_last(compact, "a"), 101)
+            listed = CharArrayList(text)
+            self.assertEqual(self.search.find_first(listed, "b"), 101)
+            self.assertEqual(self.search.find_last(listed, "q"), -1)
+        share.assert_not_called()
+        self.assertEqual(self.search.find_first(compact, "\u03c9"), 1)
+        self.assertEqual(self.search.find_first(compact, "q"), -1)
+
+    def test_reversed_and_empty_lists(self):
+        lst = CharArrayList("abcab")
+        lst.reverse()
+        self.assertEqual(self.search.find_first(lst, "a"), 1)
+        self.assertEqual(self.search.find_last(lst, "b"), 3)
+        self.search.delete_all(lst, "c")
+        self.assertEqual(lst.to_string(), "baba")
+        empty = CharArrayList()
+        self.assertEqual(self.search.find_first(empty, "a"), -1)
+        self.search.delete_all(empty, "a")
+        self.assertEqual(empty.length(), 0)
+
+    def test_search_leaves_shared_and_reversed_storage_alone(self):
+        original = CharArrayList.from_string("xyza\u03c9" * 50, storage=STORAGE_COMPACT)
+        lst = original.clone()
+        lst.reverse()
+        self.assertEqual(self.search.find_first(lst, "a"), 1)
+        self.assertEqual(self.search.find_last(lst, "\u03c9"), 245)
+        self.assertIs(lst._data, original._data)
+        self.assertTrue(lst.is_reversed)
+        lst.append("q")
+        self.assertEqual(original.to_string(), "xyza\u03c9" * 50)
+
+    def test_latin1_compact_storage_stays_serial(self):
+        with ParallelSearch(max_workers=2, threshold=0) as search:
+            lst = CharArrayList.from_string("abcabc", storage=STORAGE_COMPACT)
+            self.assertEqual(search.find_last(lst, "a"), 3)
+            search.delete_all(lst, "b")
+            self.assertEqual(lst.to_string(), "acac")
+            self.assertIsNone(search._executor)
+
+    def test_falls_back_below_threshold(self):
+        with ParallelSearch(max_workers=2, threshold=100) as search:
+            lst = CharArrayList("abcabc")
+            self.assertEqual(search.find_last(lst, "a"), 3)
+            search.delete_all(lst, "b")
+            self.assertEqual(lst.to_string(), "acac")
+            linked = CharDoublyLinkedList("a" * 200 + "b")
+            self.assertEqual(search.find_first(linked, "b"), 200)
+            self.assertIsNone(search._executor)
+        with self.assertRaises(ValueError):
+            ParallelSearch(max_workers=0)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def tearDown(self):
+        char_instrumentation.disable()
+        char_instrumentation.reset()
+
+    def test_records_calls_and_traversals(self):
+        with char_instrumentation.instrumented():
+            self.assertTrue(char_instrumentation.is_enabled())
+            lst = CharDoublyLinkedList("abcdefghij")
+            lst.get(3)
+            lst.get(8)
+            lst.insert("x", 2)
+            CharArrayList("ab").findLast("a")
+            stats = char_instrumentation.snapshot()
+            self.assertEqual(json.loads(char_instrumentation.to_json()), stats)
+        methods = stats["methods"]
+        self.assertEqual(methods["CharDoublyLinkedList.get"]["calls"], 2)
+        self.assertEqual(methods["CharDoublyLinkedList.insert"]["calls"], 1)
+        self.assertEqual(methods["CharArrayList.findLast"]["calls"], 1)
+        self.assertEqual(
+            sum(methods["CharDoublyLinkedList.get"]["latency_ns"].values()), 2
+        )
+        traversal = stats["traversals"]["CharDoublyLinkedList"]
+        self.assertEqual(traversal["lookups"], 3)
+        self.assertEqual(traversal["total_steps"], 3 + 1 + 2)
+        self.assertEqual(traversal["steps"], {"1": 1, "2": 1, "4": 1})
+
+    def test_records_only_outermost_call(self):
+        with char_instrumentation.instrumented():
+            lst = CharDoublyLinkedList("abcdefghij")
+            for i in range(5):
+                lst.get(i)
+            lst.insert("x", lst.length())
+            methods = char_instrumentation.snapshot()["methods"]
+        self.assertEqual(methods["CharDoublyLinkedList.get"]["calls"], 5)
+        self.assertEqual(methods["CharDoublyLinkedList.insert"]["calls"], 1)
+        self.assertEqual(methods["CharDoublyLinkedList.length"]["calls"], 1)
+        self.assertNotIn("CharDoublyLinkedList.append", methods)
+
+    def test_wraps_inherited_methods(self):
+        original_insert = CharVersionedList.insert
+        with char_instrumentation.instrumented(CharVersionedList):
+            lst = CharVersionedList("abc")
+            lst.insert("x", 1)
+            lst.get(0)
+            methods = char_instrumentation.snapshot()["methods"]
+        self.assertEqual(methods["CharVersionedList.insert"]["calls"], 1)
+        self.assertEqual(methods["CharVersionedList.get"]["calls"], 1)
+        self.assertNotIn("insert", vars(CharVersionedList))
+        self.assertIs(CharVersionedList.insert, original_insert)
+
+    def test_skips_streaming_methods(self):
+        originals = [
+            CharArrayList.iter_chunks,
+            CharArrayList.aiter_chunks,
+            CharArrayList.aextend_from,
+        ]
+        with char_instrumentation.instrumented(CharArrayList):
+            self.assertEqual(
+                [
+                    CharArrayList.iter_chunks,
+                    CharArrayList.aiter_chunks,
+                    CharArrayList.aextend_from,
+                ],
+                originals,
+            )
+
+    def test_disable_restores_original_methods(self):
+        original_get = CharArrayList.get
+        char_instrumentation.enable(CharArrayList)
+        self.assertIsNot(CharArrayList.get, original_get)
+        CharArrayList("abc").get(0)
+        char_instrumentation.disable()
+        self.assertIs(CharArrayList.get, original_get)
+        self.assertIsNone(CharDoublyLinkedList._traversal_observer)
+        self.assertFalse(char_instrumentation.is_enabled())
+        CharArrayList("abc").get(1)
+        methods = char_instrumentation.snapshot()["methods"]
+        self.assertEqual(methods["CharArrayList.get"]["calls"], 1)
+        char_instrumentation.reset()
+        self.assertEqual(char_instrumentation.snapshot()["methods"], {})
+
+
+class TestSerialization(unittest.TestCase):
+    def test_bytes_round_trip(self):
+        text = "ascii, кирилиця, \U0001f600 and \ud800"
+        for cls in (CharArrayList, CharDoublyLinkedList):
+            for encoding in ("utf-8", "utf-32"):
+                with self.subTest(cls=cls.__name__, encoding=encoding):
+                    data = cls(text).to_bytes(encoding)
+                    self.assertTrue(data.startswith(b"CHLS\x01"))
+                    restored = cls.from_bytes(data)
+                    self.assertIsInstance(restored, cls)
+                    self.assertEqual(restored.to_string(), text)
+                    self.assertEqual(
+                        cls.from_bytes(memoryview(data)).length(), len(text)
+                    )
+        compact = CharArrayList.from_bytes(
+            CharDoublyLinkedList("abc").to_bytes(), storage=STORAGE_COMPACT
+        )
+        self.assertEqual(compact.storage, STORAGE_COMPACT)
+        self.assertEqual(compact.to_string(), "abc")
+
+    def test_rejects_malformed_data(self):
+        data = CharArrayList("abc").to_bytes()
+        with self.assertRaises(ValueError):
+            CharArrayList.from_bytes(b"XXXX" + data[4:])
+        with self.assertRaises(ValueError):
+            CharArrayList.from_bytes(data[:4] + b"\x02" + data[5:])
+        with self.assertRaises(ValueError):
+            CharArrayList.from_bytes(data[:-1])
+        with self.assertRaises(ValueError):
+            CharArrayList.from_bytes(data[:5])
+        with self.assertRaises(ValueError):
+            CharArrayList("abc").to_bytes("latin-1")
+        with self.assertRaises(TypeError):
+            CharDoublyLinkedList.from_bytes("abc")
+
+    def test_pickle_long_lists_and_options(self):
+        text = "abcdefghij" * 20000
+        linked = CharDoublyLinkedList(text, node_pool_size=8)
+        linked.reverse()
+        restored = pickle.loads(pickle.dumps(linked))
+        self.assertEqual(restored.to_string(), text[::-1])
+        self.assertEqual(restored._node_pool_size, 8)
+        self.assertIs(restored.tail.next, None)
+        restored.append("z")
+        self.assertEqual(restored.get(len(text)), "z")
+
+        for lst in (
+            CharArrayList(text),
+            CompactCharArrayList("caf\xe9"),
+            CharArrayList("ωmega", storage=STORAGE_COMPACT),
+        ):
+            with self.subTest(lst=type(lst).__name__, storage=lst.storage):
+                restored = pickle.loads(pickle.dumps(lst))
+                self.assertIs(type(restored), type(lst))
+                self.assertEqual(restored.storage, lst.storage)
+                self.assertEqual(restored.to_string(), lst.to_string())
+
+
+class TestAsyncStreaming(unittest.TestCase):
+    def test_aextend_from_decodes_split_characters(self):
+        text = "привіт, світ! " * 40
+
+        async def ingest(lst):
+            reader = asyncio.StreamReader()
+            reader.feed_data(text.encode("utf-8"))
+            reader.feed_eof()
+            ticks = []
+
+            async def ticker():
+                while True:
+                    ticks.append(None)
+                    await asyncio.sleep(0)
+
+            task = asyncio.ensure_future(ticker())
+            consumed = await lst.aextend_from(reader, chunk_size=7)
+            task.cancel()
+            return consumed, len(ticks)
+
+        for cls in (CharArrayList, CharDoublyLinkedList):
+            with self.subTest(cls=cls.__name__):
+                lst = cls("> ")
+                consumed, ticks = asyncio.run(ingest(lst))
+                self.assertEqual(consumed, len(text))
+                self.assertEqual(lst.to_string(), "> " + text)
+                self.assertGreater(ticks, 10)
+
+    def test_aiter_chunks(self):
+        async def collect(lst):
+            return [chunk async for chunk in lst.aiter_chunks(4)]
+
+        for lst in (CharArrayList("abcdefghij"), CharDoublyLinkedList("abcdefghij")):
+            with self.subTest(lst=type(lst).__name__):
+                self.assertEqual(asyncio.run(collect(lst)), ["abcd", "efgh", "ij"])
+
+
+FUZZ_OPS = int(os.environ.get("CHAR_LIST_FUZZ_OPS", "400"))
+FUZZ_SEED = int(os.environ.get("CHAR_LIST_FUZZ_SEED", "0"))
+
+
+class ReferenceCharList:
+    def __init__(self, items=None):
+        self.items = list(items or [])
+
+    def _check_char(self, element):
+        if not isinstance(element, str) or len(element) != 1:
+            raise TypeError(element)
+
+    def _check_index(self, index, limit):
+        if not isinstance(index, int):
+            raise TypeError(index)
+        if not 0 <= index < limit:
+            raise IndexError(index)
+
+    def length(self):
+        return len(self.items)
+
+    def append(self, element):
+        self._check_char(element)
+        self.items.append(element)
+
+    def insert(self, element, index):
+        self._check_char(element)
+        self._check_index(index, len(self.items) + 1)
+        self.items.insert(index, element)
+
+    def delete(self, index):
+        if not self.items:
+            raise IndexError(index)
+        self._check_index(index, len(self.items))
+        return self.items.pop(index)
+
+    def deleteAll(self, element):
+        self._check_char(element)
+        self.items = [item for item in self.items if item != element]
+
+    def get(self, index):
+        if not self.items:
+            raise IndexError(index)
+        self._check_index(index, len(self.items))
+        return self.items[index]
+
+    def clone(self):
+        return ReferenceCharList(self.items)
+
+    def reverse(self):
+        self.items.reverse()
+
+    def findFirst(self, element):
+        self._check_char(element)
+        return self.items.index(element) if element in self.items else -1
+
+    def findLast(self, element):
+        self._check_char(element)
+        if element not in self.items:
+            return -1
+        return len(self.items) - 1 - self.items[::-1].index(element)
+
+    def count(self, element):
+        self._check_char(element)
+        return self.items.count(element)
+
+    def clear(self):
+        self.items = []
+
+    def extend(self, other):
+        self.items.extend(other.items)
+
+    def extend_from_str(self, text):
+        if not isinstance(text, str):
+            raise TypeError(text)
+        self.items.extend(text)
+
+    def to_string(self):
+        return "".join(self.items)
+
+    def __getitem__(self, index):
+        return ReferenceCharList(self.items[index])
+
+
+class TestDifferentialFuzz(unittest.TestCase):
+    factories = {
+        "array": CharArrayList,
+        "array-compact": CompactCharArrayList,
+        "linked": CharDoublyLinkedList,
+        "linked-pooled": lambda: CharDoublyLinkedList(node_pool_size=4),
+        "unrolled": lambda: CharUnrolledLinkedList(block_size=4),
+        "rope": CharRopeList,
+        "versioned": lambda: CharVersionedList(max_versions=5),
+        "gap": CharGapBufferList,
+        "adaptive": lambda: CharAdaptiveList(window=16),
+        "concurrent": lambda: ConcurrentCharList(list_class=CharDoublyLinkedList),
+    }
+
+    def _element(self, rng):
+        if rng.random() < 0.05:
+            return rng.choice(["", "ab", 7, None])
+        return rng.choice("abcé")
+
+    def _index(self, rng, limit):
+        if rng.random() < 0.03:
+            return "1"
+        return (
+            rng.randint(-2, limit + 2)
+            if rng.random() < 0.1
+            else rng.randint(0, max(limit, 0))
+        )
+
+    def _operation(self, rng, size):
+        choice = rng.random()
+        element = self._element(rng)
+        if choice < 0.25:
+            index = self._index(rng, size)
+            return f"insert({element!r}, {index!r})", lambda t: t.insert(element, index)
+        if choice < 0.45:
+            index = self._index(rng, size - 1)
+            return f"delete({index!r})", lambda t: t.delete(index)
+        if choice < 0.55:
+            index = self._index(rng, size - 1)
+            return f"get({index!r})", lambda t: t.get(index)
+        if choice < 0.62:
+            return f"append({element!r})", lambda t: t.append(element)
+        if choice < 0.67:
+            text = "".join(rng.choice("abcé") for _ in range(rng.randrange(9)))
+            return f"extend_from_str({text!r})", lambda t: t.extend_from_str(text)
+        if choice < 0.72:
+            return "reverse()", lambda t: t.reverse()
+        if choice < 0.78:
+            return f"findFirst({element!r})", lambda t: t.findFirst(element)
+        if choice < 0.84:
+            return f"findLast({element!r})", lambda t: t.findLast(element)
+        if choice < 0.87:
+            return f"count({element!r})", lambda t: t.count(element)
+        if choice < 0.90:
+            return f"deleteAll({element!r})", lambda t: t.deleteAll(element)
+        if choice < 0.93:
+            start, stop = sorted(rng.randint(0, size) for _ in range(2))
+            return f"[{start}:{stop}]", lambda t: t[start:stop].to_string()
+        if choice < 0.96:
+            return "clone().append('z')", self._mutate_clone
+        if choice < 0.98 and size < 200:
+            return "extend(clone())", lambda t: t.extend(t.clone())
+        if choice < 0.985:
+            return "clear()", lambda t: t.clear()
+        return "length()", lambda t: t.length()
+
+    def _mutate_clone(self, target):
+        copy = target.clone()
+        copy.append("z")
+        return copy.to_string()
+
+    def _apply(self, operation, target):
+        try:
+            return "returned", operation(target)
+        except (IndexError, TypeError) as error:
+            return "raised", type(error)
+
+    def _check_invariants(self, lst):
+        if isinstance(lst, ConcurrentCharList):
+            lst = lst._list
+        if isinstance(lst, CharDoublyLinkedList):
+            nodes = list(lst._iter_nodes())
+            self.assertEqual(len(nodes), lst._size)
+            self.assertIs(lst.head, nodes[0] if nodes else None)
+            self.assertIs(lst.tail, nodes[-1] if nodes else None)
+            if nodes:
+                self.assertIsNone(nodes[0].prev)
+            for previous, node in zip(nodes, nodes[1:]):
+                self.assertIs(node.prev, previous)
+            if lst._finger_node is not None:
+                self.assertIs(nodes[lst._finger_index], lst._finger_node)
+        elif isinstance(lst, CharUnrolledLinkedList):
+            blocks = list(lst._iter_blocks())
+            self.assertTrue(all(0 < len(b.data) <= lst.block_size for b in blocks))
+            self.assertEqual(sum(len(b.data) for b in blocks), lst.length())
+            self.assertIs(lst.tail, blocks[-1] if blocks else None)
+
+    def _run_trace(self, factory, seed, operations):
+        rng = random.Random(seed)
+        reference = ReferenceCharList()
+        lst = factory()
+        for step in range(operations):
+            description, operation = self._operation(rng, reference.length())
+            expected = self._apply(operation, reference)
+            actual = self._apply(operation, lst)
+            message = f"seed {seed}, step {step}: {description}"
+            self.assertEqual(actual, expected, message)
+            self.assertEqual(lst.to_string(), reference.to_string(), message)
+            self.assertEqual(lst.length(), reference.length(), message)
+            self._check_invariants(lst)
+
+    def test_matches_reference_model(self):
+        for offset, (name, factory) in enumerate(sorted(self.factories.items())):
+            with self.subTest(implementation=name):
+                self._run_trace(factory, FUZZ_SEED + offset, FUZZ_OPS)
+
+
 if __name__ == "__main__":
     unittest.main()